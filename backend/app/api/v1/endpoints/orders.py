@@ -13,7 +13,7 @@ from app import schemas, crud
 from app.models.models import OrderStatus
 from app.api.deps import get_db, get_current_user
 from app.utils.pdf_generator import generate_receipt
-from app.utils.printer import print_receipt, print_order_chit
+from app.utils.printer import queue_receipt, queue_order_chit
 from app.core.config import settings
 
 router = APIRouter()
@@ -144,11 +144,9 @@ def create_order(order: schemas.OrderCreate, db: Session = Depends(get_db)):
         # Only print NEW items (not items that were already in the order)
         if settings.PRINTER_ENABLED:
             try:
-                chit_printed = print_order_chit(new_order, items_to_print=new_items)
-                if chit_printed:
-                    logger.info(f"Order chit printed for table {int(new_order.table_number)} ({len(new_items)} new items)")
-                else:
-                    logger.warning(f"Failed to print order chit for table {int(new_order.table_number)}")
+                # Printed on the background print worker; failures are logged there
+                if queue_order_chit(new_order, items_to_print=new_items):
+                    logger.info(f"Order chit queued for table {int(new_order.table_number)} ({len(new_items)} new items)")
             except Exception as e:
                 # Log error but don't fail the order creation
                 logger.error(f"Error printing order chit: {e}")
@@ -447,11 +445,9 @@ def generate_receipt_endpoint(
     # Auto-print if requested and printer is enabled
     if auto_print and settings.PRINTER_ENABLED:
         try:
-            print_success = print_receipt(order)
-            if print_success:
-                print("✓ Receipt printed successfully")
-            else:
-                print("⚠ Print attempt failed - check printer configuration")
+            # Printed on the background print worker; failures are logged there
+            if queue_receipt(order):
+                print("✓ Receipt queued for printing")
         except Exception as e:
             # Log error but don't fail the request - still return PDF
             print(f"⚠ Print error: {e}")
@@ -46,12 +46,14 @@ class Settings:
 
     # Thermal Printer Configuration
     PRINTER_ENABLED: bool = os.getenv("PRINTER_ENABLED", "false").lower() == "true"
-    PRINTER_TYPE: str = os.getenv("PRINTER_TYPE", "")  # "win32", "usb", "serial"
+    PRINTER_TYPE: str = os.getenv("PRINTER_TYPE", "")  # "win32", "usb", "serial", "network"
     PRINTER_NAME: str = os.getenv("PRINTER_NAME", "")  # Windows printer name
     PRINTER_VENDOR_ID: str = os.getenv("PRINTER_VENDOR_ID", "")  # USB vendor ID (hex)
     PRINTER_PRODUCT_ID: str = os.getenv("PRINTER_PRODUCT_ID", "")  # USB product ID (hex)
     PRINTER_PORT: str = os.getenv("PRINTER_PORT", "")  # Serial port (e.g., COM3)
     PRINTER_BAUDRATE: int = int(os.getenv("PRINTER_BAUDRATE", "9600"))  # Serial baudrate
+    PRINTER_HOST: str = os.getenv("PRINTER_HOST", "")  # Network printer IP/hostname
+    PRINTER_NETWORK_PORT: int = int(os.getenv("PRINTER_NETWORK_PORT", "9100"))  # Raw TCP port
 
     # Email / SMTP Configuration (for inventory reports)
     SMTP_ENABLED: bool = os.getenv("SMTP_ENABLED", "false").lower() == "true"
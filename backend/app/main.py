@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.db.session import init_db
+from app.utils.printer import PRINT_QUEUE_SHUTDOWN_TIMEOUT, reset_printer, wait_for_print_queue
 from app.version import __version__, get_version_info
 
 # Create FastAPI application
@@ -29,7 +30,7 @@ app.add_middleware(
 
 
 # ============================================================================
-# Startup Event
+# Startup / Shutdown Events
 # ============================================================================
 
 
@@ -39,6 +40,15 @@ def startup_event():
     init_db()
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """Finish queued print jobs (for a bounded time), then release the shared thermal printer connection."""
+    # A job still printing after the timeout holds the printer; closing it would
+    # block until that job ends, so leave the connection to the atexit hook
+    if wait_for_print_queue(timeout=PRINT_QUEUE_SHUTDOWN_TIMEOUT):
+        reset_printer()
+
+
 # ============================================================================
 # Health Check Routes
 # ============================================================================
@@ -4,6 +4,8 @@ Generates simple, large-text chits for kitchen staff.
 """
 
 import io
+import logging
+import platform
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +16,13 @@ from reportlab.pdfgen import canvas
 
 from app.core.config import settings
 from app.models import models
+from app.utils.pdf_generator import CHIT_TIME_FORMAT, format_local_datetime
+from app.utils.printer import print_combined_order_chit, print_pdf_stream_to_printer
+
+logger = logging.getLogger(__name__)
+
+# The OS never changes while the server runs, so ask once
+_SYSTEM = platform.system()
 
 
 def generate_order_chit_pdf(order: models.Order) -> io.BytesIO:
@@ -71,9 +80,7 @@ def generate_order_chit_pdf(order: models.Order) -> io.BytesIO:
     y_position -= 5 * mm
 
     # Time
-    from app.utils.pdf_generator import convert_to_local_timezone
-    local_time = convert_to_local_timezone(order.created_at)
-    c.drawString(5 * mm, y_position, f"Time: {local_time.strftime('%I:%M %p')}")
+    c.drawString(5 * mm, y_position, f"Time: {format_local_datetime(order.created_at, CHIT_TIME_FORMAT)}")
     y_position -= 5 * mm
 
     # Customer name if provided
@@ -160,27 +167,35 @@ def save_and_print_chit(order: models.Order) -> bool:
     """
     Generate order chit PDF and automatically send to printer.
 
+    On Windows with a raw-mode (win32) thermal printer, the same single chit
+    with every item is sent as ESC/POS instead, and no PDF is rendered.
+
     Args:
         order: Order model instance
 
     Returns:
         True if printing succeeded, False otherwise
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     try:
+        if _SYSTEM == 'Windows' and settings.PRINTER_ENABLED and settings.PRINTER_TYPE == "win32":
+            # Raw-mode thermal printer: the same single chit goes straight to the
+            # spooler as ESC/POS, with no PDF rendering or print-handler process
+            return print_combined_order_chit(order)
+
         # Generate PDF
         pdf_buffer = generate_order_chit_pdf(order)
 
+        if _SYSTEM == 'Linux':
+            # lp reads the PDF from stdin, so no temporary file is needed
+            return print_pdf_stream_to_printer(pdf_buffer.getvalue())
+
         # Save to temporary file
         with tempfile.NamedTemporaryFile(mode='wb', suffix='.pdf', delete=False) as tmp_file:
             tmp_file.write(pdf_buffer.getvalue())
             tmp_file_path = tmp_file.name
 
         # Auto-print using Windows
-        import platform
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             import win32print
             import win32api
 
@@ -203,8 +218,8 @@ def save_and_print_chit(order: models.Order) -> bool:
             logger.info(f"Order chit PDF sent to printer '{printer_name}' for table {order.table_number}")
             return True
         else:
-            # On non-Windows, just log (could use lpr command on Linux/Mac)
-            logger.warning(f"Auto-print not supported on {platform.system()}, PDF saved to {tmp_file_path}")
+            # Other platforms: just log (could use lpr command on Mac)
+            logger.warning(f"Auto-print not supported on {_SYSTEM}, PDF saved to {tmp_file_path}")
             return False
 
     except Exception as e:
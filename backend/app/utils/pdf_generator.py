@@ -6,12 +6,15 @@ Follows design specifications from docs/receipt-design-instructions.md
 
 import io
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO, Literal, Optional
+from typing import BinaryIO, Literal, Optional, Sequence
 from zoneinfo import ZoneInfo
 
 import qrcode
+from PIL import Image
 from reportlab.lib import colors
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
@@ -34,6 +37,23 @@ else:
 # Paper size type
 PaperSize = Literal["58mm", "80mm"]
 
+# Timezones are resolved once; settings are fixed for the life of the process
+_UTC = ZoneInfo("UTC")
+_LOCAL_TZ = ZoneInfo(settings.TIMEZONE)
+
+# Date/time formats printed on receipts and chits
+RECEIPT_DATETIME_FORMAT = "%d-%m-%Y %I:%M %p"
+CHIT_TIME_FORMAT = "%I:%M %p"
+
+# Longest side (px) of the embedded logo; it prints at most ~64mm wide, so this
+# is well above thermal printer resolution (203 dpi)
+LOGO_MAX_PIXELS = 600
+
+# Pre-bound line formatters for item rows
+_ITEM_LINE = "{}x {}".format
+_RATE_LINE_COMPACT = "@ {}".format
+_RATE_LINE = "   @ {}".format
+
 
 class ReceiptConfig:
     """Configuration for receipt generation based on paper size."""
@@ -110,10 +130,84 @@ class ReceiptConfig:
         self.receipt_height = 280 * mm  # Ample height, printer will trim
 
 
+@lru_cache(maxsize=2048)
 def format_currency(amount_in_paise: int) -> str:
     """Format currency with rupee symbol and 2 decimal places."""
-    rupees = amount_in_paise / 100
-    return f"₹{rupees:.2f}"
+    # Integer arithmetic avoids float rounding on large paise amounts
+    sign = "-" if amount_in_paise < 0 else ""
+    rupees, paise = divmod(abs(amount_in_paise), 100)
+    return f"₹{sign}{rupees}.{paise:02d}"
+
+
+@lru_cache(maxsize=256)
+def _table_number_width(table_number: int, size: float) -> float:
+    """Width of the giant chit table number; tables repeat all day so measure once."""
+    return pdfmetrics.stringWidth(str(table_number), "Helvetica-Bold", size)
+
+
+@lru_cache(maxsize=8)
+def _chit_separator(content_width: float, char: str) -> tuple[str, float]:
+    """Build a chit separator rule once per paper width; returns (text, rendered width)."""
+    width_chars = int(content_width / (2.5 * mm))  # Approximate char width
+    separator_line = char * width_chars
+    return separator_line, pdfmetrics.stringWidth(separator_line, "Courier", 10)
+
+
+def _wrap_words(text: str, font: str, size: float, max_width: float) -> list[str]:
+    """Split text into lines of whole words that fit within max_width."""
+    words = text.split()
+    lines = []
+    current_line = []
+
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        if pdfmetrics.stringWidth(test_line, font, size) <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+            else:
+                # Single word too long, just use it
+                lines.append(word)
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+
+@lru_cache(maxsize=2)
+def _name_header(paper_size: PaperSize) -> tuple[tuple[str, str, float, float, float], ...]:
+    """
+    Resolve the restaurant name header once per paper size.
+
+    Returns (text, font, size, width, drop) for each line, where drop is how
+    far to move down after drawing the line.
+    """
+    config = ReceiptConfig(paper_size)
+    restaurant_name = settings.RESTAURANT_NAME
+    font = "Helvetica-Bold"
+
+    def line(text: str, size: float, drop: float) -> tuple[str, str, float, float, float]:
+        return text, font, size, pdfmetrics.stringWidth(text, font, size), drop
+
+    # Split into two lines: "Lily" and "Cafe by Mary's Kitchen"
+    if "Lily" in restaurant_name:
+        rest_of_name = restaurant_name.replace("Lily ", "").strip()
+        return (
+            line("LILY", config.font_cafe_name, config.small_line_height * 1.4),
+            line(rest_of_name, config.font_cafe_sub_name, 0),
+        )
+
+    # Fallback: wrap other names if they don't fit
+    size = config.font_cafe_name
+    if pdfmetrics.stringWidth(restaurant_name, font, size) <= config.content_width:
+        return (line(restaurant_name, size, 0),)
+    return tuple(
+        line(text, size, size * 1.2)
+        for text in _wrap_words(restaurant_name, font, size, config.content_width)
+    )
 
 
 def convert_to_local_timezone(utc_datetime: datetime) -> datetime:
@@ -128,15 +222,75 @@ def convert_to_local_timezone(utc_datetime: datetime) -> datetime:
     """
     # If datetime is naive, assume it's UTC
     if utc_datetime.tzinfo is None:
-        utc_datetime = utc_datetime.replace(tzinfo=ZoneInfo("UTC"))
+        utc_datetime = utc_datetime.replace(tzinfo=_UTC)
 
     # Convert to configured timezone
-    local_tz = ZoneInfo(settings.TIMEZONE)
-    return utc_datetime.astimezone(local_tz)
+    return utc_datetime.astimezone(_LOCAL_TZ)
 
 
-def generate_qr_code(data: str, size: int = 100) -> ImageReader:
-    """Generate QR code image from data."""
+@lru_cache(maxsize=4)
+def _load_logo(path: str, mtime: float) -> tuple[ImageReader, int, int]:
+    """
+    Load the restaurant logo once and reuse it across receipts.
+
+    The file's modification time is part of the cache key so that a
+    replaced logo is picked up without restarting the server.
+    """
+    with Image.open(path) as img:
+        img_width, img_height = img.size
+        img.load()
+        # Downsample once so each receipt embeds a small image instead of
+        # re-encoding the full-resolution source
+        img.thumbnail((LOGO_MAX_PIXELS, LOGO_MAX_PIXELS))
+        logo = ImageReader(img.copy())
+    # Report the original size so receipt layout does not depend on the downsample
+    return logo, img_width, img_height
+
+
+def _get_logo(path: str) -> Optional[tuple[ImageReader, int, int]]:
+    """Return the cached (reader, width, height) for the logo, or None if missing."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _load_logo(path, mtime)
+
+
+def _format_receipt_datetime(local: datetime) -> str:
+    """RECEIPT_DATETIME_FORMAT without strftime's format parsing."""
+    hour = local.hour
+    return (
+        f"{local.day:02d}-{local.month:02d}-{local.year} "
+        f"{hour % 12 or 12:02d}:{local.minute:02d} {'AM' if hour < 12 else 'PM'}"
+    )
+
+
+def _format_chit_time(local: datetime) -> str:
+    """CHIT_TIME_FORMAT without strftime's format parsing."""
+    hour = local.hour
+    return f"{hour % 12 or 12:02d}:{local.minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+# Direct formatters for the formats printed on every receipt and chit
+_FAST_FORMATTERS = {
+    RECEIPT_DATETIME_FORMAT: _format_receipt_datetime,
+    CHIT_TIME_FORMAT: _format_chit_time,
+}
+
+
+@lru_cache(maxsize=512)
+def format_local_datetime(utc_datetime: datetime, fmt: str) -> str:
+    """Convert a UTC datetime to local time and format it, memoised per (datetime, format)."""
+    local = convert_to_local_timezone(utc_datetime)
+    formatter = _FAST_FORMATTERS.get(fmt)
+    if formatter is not None:
+        return formatter(local)
+    return local.strftime(fmt)
+
+
+@lru_cache(maxsize=8)
+def _qr_code_png(data: str) -> bytes:
+    """Encode a QR code as PNG bytes; the review/feedback URLs are fixed, so this runs once each."""
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_M,
@@ -148,11 +302,15 @@ def generate_qr_code(data: str, size: int = 100) -> ImageReader:
 
     img = qr.make_image(fill_color="black", back_color="white")
 
-    # Convert to ImageReader for ReportLab
     buffer = io.BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
-    return ImageReader(buffer)
+    return buffer.getvalue()
+
+
+def generate_qr_code(data: str, size: int = 100) -> ImageReader:
+    """Generate QR code image from data."""
+    # Convert to ImageReader for ReportLab
+    return ImageReader(io.BytesIO(_qr_code_png(data)))
 
 
 def generate_receipt(
@@ -167,7 +325,12 @@ def generate_receipt(
         paper_size: Paper width - either "58mm" or "80mm" (default: "80mm")
     """
     config = ReceiptConfig(paper_size)
-    c = canvas.Canvas(output, pagesize=(config.receipt_width, config.receipt_height))
+    c = canvas.Canvas(
+        output,
+        pagesize=(config.receipt_width, config.receipt_height),
+        pageCompression=1,
+        invariant=True,
+    )
 
     y_position = config.receipt_height - (config.top_margin_mm * mm)
     x_center = config.receipt_width / 2
@@ -189,24 +352,7 @@ def generate_receipt(
             return y  # Return the y position after drawing
         elif wrap:
             # Text is too long, wrap across multiple lines
-            words = text.split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                if c.stringWidth(test_line, font, size) <= max_width:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                    else:
-                        # Single word too long, just use it
-                        lines.append(word)
-
-            if current_line:
-                lines.append(' '.join(current_line))
+            lines = _wrap_words(text, font, size, max_width)
 
             # Draw all lines
             line_spacing = size * 1.2
@@ -233,12 +379,23 @@ def generate_receipt(
         width = c.stringWidth(text, font, size)
         c.drawString(config.right_margin - width, y, text)
 
+    # Separators are collected per (thickness, color) and stroked together at the end
+    pending_separators: dict[tuple[float, str], list[tuple[float, float, float, float]]] = {}
+
     def draw_separator(y: float, thickness: float = 0.35, color: str = "#CCCCCC"):
-        """Draw a horizontal separator line."""
-        c.setLineWidth(thickness)
-        c.setStrokeColor(colors.HexColor(color))
-        c.line(config.left_margin, y, config.right_margin, y)
+        """Queue a horizontal separator line."""
+        pending_separators.setdefault((thickness, color), []).append(
+            (config.left_margin, y, config.right_margin, y)
+        )
+
+    def flush_separators():
+        """Stroke all queued separators, one batch per line style."""
+        for (thickness, color), lines in pending_separators.items():
+            c.setLineWidth(thickness)
+            c.setStrokeColor(colors.HexColor(color))
+            c.lines(lines)
         c.setStrokeColor(colors.black)
+        pending_separators.clear()
 
     def add_spacing(multiplier: float = 1.0):
         """Add standard spacing."""
@@ -271,10 +428,15 @@ def generate_receipt(
     # ============================================================================
 
     # Logo if available
-    if settings.RESTAURANT_LOGO_PATH and os.path.exists(settings.RESTAURANT_LOGO_PATH):
+    cached_logo = None
+    if settings.RESTAURANT_LOGO_PATH:
+        try:
+            cached_logo = _get_logo(settings.RESTAURANT_LOGO_PATH)
+        except Exception:
+            pass
+    if cached_logo:
         try:
-            logo = ImageReader(settings.RESTAURANT_LOGO_PATH)
-            img_width, img_height = logo.getSize()
+            logo, img_width, img_height = cached_logo
             max_logo_width = config.content_width * 0.8
             max_logo_height = 20 * mm if paper_size == "80mm" else 15 * mm
             aspect_ratio = img_width / img_height
@@ -286,8 +448,9 @@ def generate_receipt(
                 logo_width = logo_height * aspect_ratio
 
             logo_x = (config.receipt_width - logo_width) / 2
+            # Pass the cached reader (not the path) so the image is decoded once per process
             c.drawImage(
-                settings.RESTAURANT_LOGO_PATH,
+                logo,
                 logo_x,
                 y_position - logo_height,
                 width=logo_width,
@@ -299,24 +462,13 @@ def generate_receipt(
         except Exception:
             pass
 
-    # Restaurant name (split into two lines: "Lily" and "Cafe by Mary's Kitchen")
-    # Check if the name contains "Lily" to split it properly
-    restaurant_name = settings.RESTAURANT_NAME
+    # Restaurant name (lines and widths precomputed per paper size)
     add_small_spacing(0.5)
-    if "Lily" in restaurant_name:
-        # First line: "Lily"
-        draw_centered("LILY", y_position, "Helvetica-Bold", config.font_cafe_name)
-        add_small_spacing(1.4)
-        # Second line: Rest of the name
-        rest_of_name = restaurant_name.replace("Lily ", "").strip()
-        draw_centered(rest_of_name, y_position, "Helvetica-Bold", config.font_cafe_sub_name)
-        add_spacing(0.9)
-    else:
-        # Fallback: use wrapping for other names
-        y_position = draw_centered(
-            restaurant_name, y_position, "Helvetica-Bold", config.font_cafe_name, wrap=True
-        )
-        add_spacing(0.9)
+    for text, font, size, width, drop in _name_header(paper_size):
+        c.setFont(font, size)
+        c.drawString(x_center - width / 2, y_position, text)
+        y_position -= drop
+    add_spacing(0.9)
 
     # Address
     draw_centered(
@@ -375,9 +527,8 @@ def generate_receipt(
     add_spacing(1)
 
     # Date and time (convert from UTC to local timezone)
-    local_time = convert_to_local_timezone(order.created_at)
     draw_left(
-        f"Date: {local_time.strftime('%d-%m-%Y %I:%M %p')}",
+        f"Date: {format_local_datetime(order.created_at, RECEIPT_DATETIME_FORMAT)}",
         y_position,
         "Helvetica",
         config.font_order_details,
@@ -426,36 +577,48 @@ def generate_receipt(
     draw_separator(y_position, thickness=0.25)
     add_small_spacing(1.5)
 
-    # Items
+    # Items - batched into a single text object (one BT/ET block in the PDF)
+    items_text = c.beginText()
+
+    def text_left(text: str, font: str, size: float):
+        """Queue left-aligned text at the current y position."""
+        items_text.setFont(font, size)
+        items_text.setTextOrigin(config.left_margin, y_position)
+        items_text.textOut(text)
+
+    def text_right(text: str, font: str, size: float):
+        """Queue right-aligned text at the current y position."""
+        width = c.stringWidth(text, font, size)
+        items_text.setFont(font, size)
+        items_text.setTextOrigin(config.right_margin - width, y_position)
+        items_text.textOut(text)
+
     for item in order.order_items:
         # Item name with quantity
         if paper_size == "58mm":
             # Compact format for narrow paper
-            item_text = f"{item.quantity}x {item.menu_item_name}"
-            draw_left(item_text, y_position, "Helvetica", config.font_item_name)
+            item_text = _ITEM_LINE(item.quantity, item.menu_item_name)
+            text_left(item_text, "Helvetica", config.font_item_name)
             add_small_spacing(1)
             # Rate and amount on same line
-            rate_text = f"@ {format_currency(item.unit_price)}"
+            rate_text = _RATE_LINE_COMPACT(format_currency(item.unit_price))
             amount_text = format_currency(item.subtotal)
-            draw_left(rate_text, y_position, "DejaVuSansMono", config.font_amount - 1)
-            draw_right(amount_text, y_position, "DejaVuSansMono", config.font_amount)
+            text_left(rate_text, "DejaVuSansMono", config.font_amount - 1)
+            text_right(amount_text, "DejaVuSansMono", config.font_amount)
             add_spacing(1.5)
         else:
             # Standard format for wider paper
             # Item quantity and name
-            draw_left(
-                f"{item.quantity}x {item.menu_item_name}",
-                y_position,
-                "Helvetica",
-                config.font_item_name,
-            )
+            text_left(_ITEM_LINE(item.quantity, item.menu_item_name), "Helvetica", config.font_item_name)
             add_small_spacing(1.25)
             # Rate and amount on next line with indent
-            rate_text = f"   @ {format_currency(item.unit_price)}"
-            draw_left(rate_text, y_position, "DejaVuSansMono", config.font_amount - 1)
-            draw_right(format_currency(item.subtotal), y_position, "DejaVuSansMono", config.font_amount)
+            rate_text = _RATE_LINE(format_currency(item.unit_price))
+            text_left(rate_text, "DejaVuSansMono", config.font_amount - 1)
+            text_right(format_currency(item.subtotal), "DejaVuSansMono", config.font_amount)
             add_spacing(1.1)
 
+    c.drawText(items_text)
+
     draw_separator(y_position)
     add_spacing(1)
 
@@ -463,49 +626,50 @@ def generate_receipt(
     # TOTALS SECTION
     # ============================================================================
 
-    # Subtotal
-    draw_row(
-        "Subtotal:",
-        format_currency(order.subtotal),
-        left_size=config.font_subtotal,
-        right_size=config.font_subtotal,
-        spacing=1.5,
-    )
-
-    # GST breakdown (CGST + SGST)
+    # Row positions are known up front, so the whole block is emitted as one
+    # text object with each font set once instead of a setFont per cell
     half_gst_rate = settings.GST_RATE / 2
     cgst_amount = order.gst_amount // 2
     sgst_amount = order.gst_amount - cgst_amount
 
-    draw_row(
-        f"CGST ({half_gst_rate}%):",
-        format_currency(cgst_amount),
-        left_size=config.font_subtotal,
-        right_size=config.font_subtotal,
-        spacing=1.5,
-    )
-    draw_row(
-        f"SGST ({half_gst_rate}%):",
-        format_currency(sgst_amount),
-        left_size=config.font_subtotal,
-        right_size=config.font_subtotal,
-        spacing=0.5,  # More spacing after last tax line
-    )
+    # (label, amount, spacing after row)
+    tax_rows = [
+        ("Subtotal:", format_currency(order.subtotal), 1.5),
+        (f"CGST ({half_gst_rate}%):", format_currency(cgst_amount), 1.5),
+        (f"SGST ({half_gst_rate}%):", format_currency(sgst_amount), 0.5),  # More spacing after last tax line
+    ]
+    row_positions = []
+    for _, _, spacing in tax_rows:
+        row_positions.append(y_position)
+        add_small_spacing(spacing)
+
+    totals_text = c.beginText()
+    totals_text.setFont("Helvetica", config.font_subtotal)
+    for (label, _, _), row_y in zip(tax_rows, row_positions, strict=True):
+        totals_text.setTextOrigin(config.left_margin, row_y)
+        totals_text.textOut(label)
+    totals_text.setFont("DejaVuSansMono", config.font_subtotal)
+    for (_, amount, _), row_y in zip(tax_rows, row_positions, strict=True):
+        width = c.stringWidth(amount, "DejaVuSansMono", config.font_subtotal)
+        totals_text.setTextOrigin(config.right_margin - width, row_y)
+        totals_text.textOut(amount)
 
     # Separator before total
     draw_separator(y_position, thickness=0.5)
     add_spacing(2)  # More spacing after separator
 
     # TOTAL (prominent)
-    draw_row(
-        "TOTAL:",
-        format_currency(order.total_amount),
-        left_font="Helvetica-Bold",
-        left_size=config.font_total,
-        right_font="DejaVuSansMono",
-        right_size=config.font_total,
-        spacing=1.5,  # More spacing after total
-    )
+    total_text = format_currency(order.total_amount)
+    totals_text.setFont("Helvetica-Bold", config.font_total)
+    totals_text.setTextOrigin(config.left_margin, y_position)
+    totals_text.textOut("TOTAL:")
+    totals_text.setFont("DejaVuSansMono", config.font_total)
+    width = c.stringWidth(total_text, "DejaVuSansMono", config.font_total)
+    totals_text.setTextOrigin(config.right_margin - width, y_position)
+    totals_text.textOut(total_text)
+    add_small_spacing(1.5)  # More spacing after total
+
+    c.drawText(totals_text)
 
     # ============================================================================
     # PAYMENT SECTION (commented out for now)
@@ -609,13 +773,55 @@ def generate_receipt(
     #     draw_centered("Feedback Form", y_position, "Helvetica", config.font_qr_label)
     #     add_spacing(0.5)
 
+    flush_separators()
+
     # Save the PDF
     c.showPage()
     c.save()
 
 
+def _generate_receipt_bytes(order: models.Order, paper_size: PaperSize) -> bytes:
+    """Render one receipt in memory (process pool worker)."""
+    buffer = io.BytesIO()
+    generate_receipt(order, buffer, paper_size=paper_size)
+    return buffer.getvalue()
+
+
+def generate_receipts_bulk(
+    orders: Sequence[models.Order],
+    paper_size: PaperSize = "80mm",
+    max_workers: Optional[int] = None,
+) -> list[bytes]:
+    """
+    Generate receipt PDFs for many orders in parallel (e.g. end-of-day export).
+
+    Receipt rendering is CPU-bound and independent per order, so the work is
+    spread across a process pool. Orders are pickled to the workers, so their
+    order_items must already be loaded before calling this.
+
+    Args:
+        orders: Order model instances with items loaded
+        paper_size: Paper width - either "58mm" or "80mm" (default: "80mm")
+        max_workers: Pool size (defaults to the number of CPUs)
+
+    Returns:
+        PDF bytes for each order, in the same order as the input
+    """
+    if len(orders) <= 1:
+        return [_generate_receipt_bytes(order, paper_size) for order in orders]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate_receipt_bytes, orders, [paper_size] * len(orders)))
+
+
 def generate_order_chit_pdf(
-    order: models.Order, output: BinaryIO, paper_size: PaperSize = "80mm", items_to_print: Optional[list] = None, station: str = "kitchen", is_parcel: bool = False
+    order: models.Order,
+    output: BinaryIO,
+    paper_size: PaperSize = "80mm",
+    items_to_print: Optional[list] = None,
+    station: str = "kitchen",
+    is_parcel: bool = False,
+    time_text: Optional[str] = None,
 ) -> None:
     """
     Generate a simple order chit (kitchen ticket) PDF.
@@ -634,12 +840,18 @@ def generate_order_chit_pdf(
                        If None, prints all items in the order.
         station: "kitchen", "bar", or "parcel" — shown as label at the bottom
         is_parcel: Deprecated. Use station="parcel" instead.
+        time_text: Pre-formatted order time; formatted from order.created_at if omitted
     """
     # Support legacy is_parcel parameter
     if is_parcel:
         station = "parcel"
     config = ReceiptConfig(paper_size)
-    c = canvas.Canvas(output, pagesize=(config.receipt_width, config.receipt_height))
+    c = canvas.Canvas(
+        output,
+        pagesize=(config.receipt_width, config.receipt_height),
+        pageCompression=1,
+        invariant=True,
+    )
 
     y_position = config.receipt_height - (config.top_margin_mm * mm)
     x_center = config.receipt_width / 2
@@ -660,10 +872,9 @@ def generate_order_chit_pdf(
 
     def draw_separator(y: float, char: str = "="):
         """Draw a text-based separator line."""
+        separator_line, width = _chit_separator(config.content_width, char)
         c.setFont("Courier", 10)
-        width_chars = int(config.content_width / (2.5 * mm))  # Approximate char width
-        separator_line = char * width_chars
-        draw_centered(separator_line, y, "Courier", 10)
+        c.drawString(x_center - width / 2, y, separator_line)
 
     def add_spacing(mm_spacing: float):
         """Add spacing in millimeters."""
@@ -683,7 +894,9 @@ def generate_order_chit_pdf(
 
     # Draw table number in GIANT font (much larger than before!)
     table_number_size = 120 if paper_size == "80mm" else 80  # MASSIVE - easily visible from across kitchen
-    draw_centered(str(order.table_number), y_position, "Helvetica-Bold", table_number_size)
+    c.setFont("Helvetica-Bold", table_number_size)
+    table_number_width = _table_number_width(order.table_number, table_number_size)
+    c.drawString(x_center - table_number_width / 2, y_position, str(order.table_number))
     add_spacing(45)  # Extra spacing after large number
 
     # Separator
@@ -695,10 +908,14 @@ def generate_order_chit_pdf(
     # ============================================================================
 
     # Order number and time
-    local_time = convert_to_local_timezone(order.created_at)
     draw_centered(f"Order: {order.order_number}", y_position, "Helvetica", 11)
     add_spacing(5)
-    draw_centered(f"Time: {local_time.strftime('%I:%M %p')}", y_position, "Helvetica", 11)
+    draw_centered(
+        f"Time: {time_text or format_local_datetime(order.created_at, CHIT_TIME_FORMAT)}",
+        y_position,
+        "Helvetica",
+        11,
+    )
     add_spacing(5)
 
     # Customer name if present
@@ -719,7 +936,7 @@ def generate_order_chit_pdf(
 
     for item in items:
         # Item with large quantity and name (NO PRICES - kitchen doesn't need them)
-        item_text = f"{item.quantity}x {item.menu_item_name}"
+        item_text = _ITEM_LINE(item.quantity, item.menu_item_name)
         draw_left(item_text, y_position, "Helvetica-Bold", 16)
         add_spacing(10)
 
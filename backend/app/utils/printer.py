@@ -1,6 +1,6 @@
 """
 Thermal printer utility for direct ESC/POS printing and PDF-based printing.
-Supports Windows (Win32Raw), USB, and Serial connections.
+Supports Windows (Win32Raw), USB, Serial, and Network (TCP) connections.
 Also supports PDF-based printing for better font control.
 """
 
@@ -9,15 +9,45 @@ import os
 import tempfile
 import subprocess
 import platform
+import threading
+import time
+import atexit
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from operator import attrgetter
+from types import SimpleNamespace
 from typing import Optional
 from datetime import datetime
 from io import BytesIO
 
 from app.core.config import settings
 from app.models import models
+from app.utils.pdf_generator import (
+    CHIT_TIME_FORMAT,
+    RECEIPT_DATETIME_FORMAT,
+    format_local_datetime,
+    generate_order_chit_pdf,
+)
 
 logger = logging.getLogger(__name__)
 
+# The OS never changes while the server runs, so ask once
+_SYSTEM = platform.system()
+
+# python-escpos is optional at import time; get_printer() reports it if missing
+try:
+    from escpos.printer import Network, Serial, Usb, Win32Raw
+except ImportError:
+    Win32Raw = Usb = Serial = Network = None
+
+# Record copies of printed chits are kept here
+CHITS_DIR = os.path.join(os.getcwd(), "chits")
+
+# Saving the record PDF is off the print path, so it runs on a single background worker
+_chit_pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chit-pdf")
+
 
 # ASCII art for digits 0-9 using hash symbols (for huge, readable table numbers)
 ASCII_DIGITS = {
@@ -114,6 +144,25 @@ ASCII_DIGITS = {
 }
 
 
+def _render_digit_art(digit: str) -> tuple:
+    """Return the art for one digit with each '#' replaced by the digit itself."""
+    table = str.maketrans('#', digit)
+    return tuple(line.translate(table) for line in ASCII_DIGITS[digit])
+
+
+# Self-referential art, built once
+_SINGLE_DIGIT_ART = {digit: _render_digit_art(digit) for digit in ASCII_DIGITS}
+
+
+@lru_cache(maxsize=100)
+def _double_digit_art(digits: str) -> tuple:
+    """Two digits side by side with spacing, for tables 10-99; built on first use."""
+    return tuple(
+        left + "  " + right
+        for left, right in zip(_SINGLE_DIGIT_ART[digits[0]], _SINGLE_DIGIT_ART[digits[1]], strict=True)
+    )
+
+
 def create_ascii_art_number(number: int) -> list:
     """
     Create ASCII art representation of a number using the number itself.
@@ -128,33 +177,22 @@ def create_ascii_art_number(number: int) -> list:
     """
     num_str = str(number)
 
-    # For single digit
-    if len(num_str) == 1:
-        # Replace '#' with the actual digit to make it self-referential
-        digit = num_str[0]
-        art = ASCII_DIGITS[digit]
-        return [line.replace('#', digit) for line in art]
-
-    # For two digits, combine them side by side
-    if len(num_str) == 2:
-        digit1_char = num_str[0]
-        digit2_char = num_str[1]
-
-        # Get art for each digit and replace # with the actual digit
-        digit1_art = [line.replace('#', digit1_char) for line in ASCII_DIGITS[digit1_char]]
-        digit2_art = [line.replace('#', digit2_char) for line in ASCII_DIGITS[digit2_char]]
-
-        # Combine side by side with spacing
-        combined = []
-        for i in range(len(digit1_art)):
-            combined.append(digit1_art[i] + "  " + digit2_art[i])
-
-        return combined
+    # One and two digit numbers come from the cached art
+    if num_str in _SINGLE_DIGIT_ART:
+        return list(_SINGLE_DIGIT_ART[num_str])
+    if len(num_str) == 2 and num_str[0] in _SINGLE_DIGIT_ART and num_str[1] in _SINGLE_DIGIT_ART:
+        return list(_double_digit_art(num_str))
 
     # For 3+ digits, just return the number as is
     return [f"  {num_str}  "]
 
 
+@lru_cache(maxsize=8)
+def _parse_usb_id(value) -> int:
+    """USB vendor/product ID from settings ("0x0dd4", "0dd4" or an int), parsed once per value."""
+    return int(value, 16) if isinstance(value, str) else value
+
+
 def get_printer():
     """
     Get printer instance based on configuration.
@@ -175,11 +213,9 @@ def get_printer():
         logger.warning("PRINTER_ENABLED is true but PRINTER_TYPE not set")
         return None
 
-    try:
-        from escpos.printer import Win32Raw, Usb, Serial
-    except ImportError as e:
+    if Usb is None:
         logger.error("python-escpos library not installed. Run: uv add python-escpos")
-        raise ImportError("python-escpos library not available") from e
+        raise ImportError("python-escpos library not available")
 
     printer_type = settings.PRINTER_TYPE.lower()
 
@@ -196,9 +232,8 @@ def get_printer():
             if not settings.PRINTER_VENDOR_ID or not settings.PRINTER_PRODUCT_ID:
                 raise ValueError("PRINTER_VENDOR_ID and PRINTER_PRODUCT_ID must be set for usb printer type")
 
-            # Convert hex strings to integers
-            vendor_id = int(settings.PRINTER_VENDOR_ID, 16) if isinstance(settings.PRINTER_VENDOR_ID, str) else settings.PRINTER_VENDOR_ID
-            product_id = int(settings.PRINTER_PRODUCT_ID, 16) if isinstance(settings.PRINTER_PRODUCT_ID, str) else settings.PRINTER_PRODUCT_ID
+            vendor_id = _parse_usb_id(settings.PRINTER_VENDOR_ID)
+            product_id = _parse_usb_id(settings.PRINTER_PRODUCT_ID)
 
             logger.info(f"Connecting to USB printer: VID={hex(vendor_id)}, PID={hex(product_id)}")
             return Usb(vendor_id, product_id)
@@ -210,131 +245,561 @@ def get_printer():
             logger.info(f"Connecting to serial printer: {settings.PRINTER_PORT} @ {settings.PRINTER_BAUDRATE} baud")
             return Serial(settings.PRINTER_PORT, baudrate=settings.PRINTER_BAUDRATE)
 
+        elif printer_type == "network":
+            # Ethernet/Wi-Fi printer on a raw TCP port
+            if not settings.PRINTER_HOST:
+                raise ValueError("PRINTER_HOST must be set for network printer type")
+            logger.info(f"Connecting to network printer: {settings.PRINTER_HOST}:{settings.PRINTER_NETWORK_PORT}")
+            return Network(settings.PRINTER_HOST, port=settings.PRINTER_NETWORK_PORT)
+
         else:
-            raise ValueError(f"Invalid PRINTER_TYPE: {settings.PRINTER_TYPE}. Must be 'win32', 'usb', or 'serial'")
+            raise ValueError(f"Invalid PRINTER_TYPE: {settings.PRINTER_TYPE}. Must be 'win32', 'usb', 'serial', or 'network'")
 
     except Exception as e:
         logger.error(f"Failed to connect to printer: {e}")
         raise
 
 
+# One printer connection shared by every print job (see printer_session)
+_printer_lock = threading.Lock()
+_shared_printer = None
+# Jobs completed on the current connection; 0 means it was just opened
+_shared_printer_jobs = 0
+
+
+def _close_shared_printer() -> None:
+    """Close and forget the shared connection. Caller must hold _printer_lock."""
+    global _shared_printer
+    if _shared_printer is not None:
+        try:
+            _shared_printer.close()
+        except Exception:
+            pass
+        _shared_printer = None
+
+
+@contextmanager
+def printer_session():
+    """
+    Yield the shared printer connection for one print job.
+
+    The connection (USB claim, serial port, TCP handshake) is opened on first
+    use and reused by later jobs; the lock keeps concurrent requests from
+    interleaving their bytes. A job that raises drops the connection so the
+    next one reconnects. Win32Raw is still closed after every job, since
+    closing is what ends the Windows spooler document.
+
+    Yields:
+        Printer instance, or None if printing is not configured
+    """
+    global _shared_printer, _shared_printer_jobs
+    with _printer_lock:
+        if _shared_printer is None:
+            _shared_printer = get_printer()
+            _shared_printer_jobs = 0
+        try:
+            yield _shared_printer
+        except BaseException:
+            _close_shared_printer()
+            raise
+        _shared_printer_jobs += 1
+        if Win32Raw is not None and isinstance(_shared_printer, Win32Raw):
+            _close_shared_printer()
+
+
+def reset_printer(timeout: Optional[float] = None) -> bool:
+    """
+    Close the shared printer connection; the next job reconnects with current settings.
+
+    Args:
+        timeout: Seconds to wait for a running job to release the printer; None
+            waits indefinitely. On timeout the connection is left open.
+
+    Returns:
+        True if the connection was closed (or there was none), False on timeout
+    """
+    if not _printer_lock.acquire(timeout=-1 if timeout is None else timeout):
+        logger.warning("Printer still busy after %.0f s; leaving its connection open", timeout)
+        return False
+    try:
+        _close_shared_printer()
+    finally:
+        _printer_lock.release()
+    return True
+
+
+# Don't hold up interpreter exit behind a job stuck on an unreachable printer
+atexit.register(reset_printer, timeout=0)
+
+
+def _cut_command(printer) -> bytes:
+    """
+    Feed-and-cut bytes for the printer's capability profile, as escpos's
+    cut() would send them (assume a full cutter without a profile).
+    Printers without a cutter get the tear-off feed instead.
+    """
+    profile = getattr(printer, "profile", None)
+    if profile is None or profile.supports("paperFullCut"):
+        return FEED_AND_FULL_CUT
+    if profile.supports("paperPartCut"):
+        return FEED_AND_PART_CUT
+    return PAPER_FEED
+
+
+def _print_document(data: bytes) -> bool:
+    """
+    Send a finished document, with its cut command, in a single write over
+    the shared connection.
+
+    A connection kept from an earlier job can go stale in between (printer
+    power-cycled, idle network link dropped). If writing to a reused
+    connection fails, the job is retried once on a fresh one.
+
+    Returns:
+        True if sent, False if no printer is configured
+    """
+    for attempt in (1, 2):
+        reused = False
+        try:
+            with printer_session() as printer:
+                if not printer:
+                    return False
+                reused = _shared_printer_jobs > 0
+                printer._raw(data + _cut_command(printer))
+                return True
+        except Exception as e:
+            if not reused or attempt == 2:
+                raise
+            logger.warning("Printer connection went stale, reconnecting: %s", e)
+
+
+@lru_cache(maxsize=8)
+def _gst_row_labels(gst_rate: float, is_58mm: bool) -> tuple[str, str]:
+    """CGST/SGST row labels, padded to the amount column; built once per rate and paper size."""
+    half_gst_rate = gst_rate / 2
+    cgst_label = f"CGST ({half_gst_rate}%):"
+    sgst_label = f"SGST ({half_gst_rate}%):"
+    if is_58mm:
+        return f"{cgst_label} ", f"{sgst_label} "
+    return cgst_label.ljust(28) + " ", sgst_label.ljust(28) + " "
+
+
+@lru_cache(maxsize=2048)
 def format_currency(amount_in_paise: int) -> str:
     """Format currency for printing."""
-    rupees = amount_in_paise / 100
-    return f"Rs.{rupees:.2f}"
+    # Menu prices repeat across tickets, so most calls are cache hits
+    sign = "-" if amount_in_paise < 0 else ""
+    rupees, paise = divmod(abs(amount_in_paise), 100)
+    return f"Rs.{sign}{rupees}.{paise:02d}"
+
+
+# ESC/POS control sequences used by the buffered writer
+ESC_INIT = b"\x1b@"
+ESC_ALIGN = {"left": b"\x1ba\x00", "center": b"\x1ba\x01", "right": b"\x1ba\x02"}
+ESC_BOLD = {False: b"\x1bE\x00", True: b"\x1bE\x01"}
+ESC_UNDERLINE = {False: b"\x1b-\x00", True: b"\x1b-\x01"}
+TEXT_ENCODING = "cp437"  # Printer default code page after ESC @
+TEST_PAGE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# GS ! n - character size for every (width, height) multiplier pair (1-8)
+ESC_SIZE = {
+    (width, height): b"\x1d!" + bytes([((width - 1) << 4) | (height - 1)])
+    for width in range(1, 9)
+    for height in range(1, 9)
+}
 
+# Separator rules per paper width (32 columns on 58mm, 42 on 80mm), pre-encoded
+SEP_EQ_58 = b"=" * 32 + b"\n"
+SEP_EQ_80 = b"=" * 42 + b"\n"
+SEP_DASH_58 = b"-" * 32 + b"\n"
+SEP_DASH_80 = b"-" * 42 + b"\n"
+
+# Fixed closing lines of a receipt, and the chit's handwritten-notes box
+_RECEIPT_THANKS = b"\nThank you for visiting!\n#withlovefrommary\n\n\n"
+RECEIPT_FOOTER_58 = SEP_EQ_58 + _RECEIPT_THANKS
+RECEIPT_FOOTER_80 = SEP_EQ_80 + _RECEIPT_THANKS
+CHIT_NOTES_58 = SEP_DASH_58 + b"NOTES:\n" + b"\n" * 5 + SEP_DASH_58 + b"\n"
+CHIT_NOTES_80 = SEP_DASH_80 + b"NOTES:\n" + b"\n" * 5 + SEP_DASH_80 + b"\n"
+
+# Tear-off feed for printers that can't cut; cutters feed 6 lines (ESC d 6), then GS V
+PAPER_FEED = b"\n\n\n"
+FEED_AND_FULL_CUT = b"\x1bd\x06" + b"\x1dV\x00"
+FEED_AND_PART_CUT = b"\x1bd\x06" + b"\x1dV\x01"
+
+# Receipt column layout per paper width (item name column, amount column)
+RECEIPT_LAYOUT_58 = SimpleNamespace(
+    is_58mm=True,
+    sep_dash=SEP_DASH_58,
+    name_width=20,
+    amount_width=11,
+    name_max=20,
+    name_trunc=17,
+    items_header=f"{'Item'.ljust(20)} {'Amt'.rjust(11)}\n",
+    rate_indent="  ",
+    footer=RECEIPT_FOOTER_58,
+)
+RECEIPT_LAYOUT_80 = SimpleNamespace(
+    is_58mm=False,
+    sep_dash=SEP_DASH_80,
+    name_width=28,
+    amount_width=13,
+    name_max=28,
+    name_trunc=25,
+    items_header=f"{'Item'.ljust(28)} {'Amount'.rjust(13)}\n",
+    rate_indent="   ",
+    footer=RECEIPT_FOOTER_80,
+)
+RECEIPT_LAYOUTS = {"58mm": RECEIPT_LAYOUT_58, "80mm": RECEIPT_LAYOUT_80}
+
+# Chit rules per paper width
+CHIT_LAYOUTS = {
+    "58mm": SimpleNamespace(sep_eq=SEP_EQ_58, notes=CHIT_NOTES_58),
+    "80mm": SimpleNamespace(sep_eq=SEP_EQ_80, notes=CHIT_NOTES_80),
+}
 
-def print_receipt(order: models.Order) -> bool:
+
+class EscposBuffer:
     """
-    Print receipt directly to thermal printer using ESC/POS commands.
+    In-memory ESC/POS writer with the subset of python-escpos's set()/text() used here.
+
+    A whole receipt or chit is built locally and sent to the printer in a single
+    write, instead of one transport write per text()/set() call.
+    """
+
+    def __init__(self):
+        self._buf = bytearray(ESC_INIT)
+        # Printer state right after ESC @; set() only sends what differs from it
+        self._align = "left"
+        self._bold = False
+        self._underline = False
+        self._size = (1, 1)
+
+    def set(
+        self,
+        align: Optional[str] = None,
+        bold: Optional[bool] = None,
+        underline: Optional[bool] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        """Change text style; only attributes that actually change are sent."""
+        if width is not None or height is not None:
+            size = (width or 1, height or 1)
+            if size != self._size:
+                self._size = size
+                self._buf += ESC_SIZE[size]
+        if bold is not None and bool(bold) != self._bold:
+            self._bold = bool(bold)
+            self._buf += ESC_BOLD[self._bold]
+        if underline is not None and bool(underline) != self._underline:
+            self._underline = bool(underline)
+            self._buf += ESC_UNDERLINE[self._underline]
+        if align is not None and align != self._align:
+            self._align = align
+            self._buf += ESC_ALIGN[align]
+
+    def copy(self) -> "EscposBuffer":
+        """Return an independent buffer with the same bytes and tracked style."""
+        clone = EscposBuffer.__new__(EscposBuffer)
+        clone.__dict__.update(self.__dict__)
+        clone._buf = bytearray(self._buf)
+        return clone
+
+    def raw(self, data: bytes) -> None:
+        """Append bytes that are already encoded for the printer."""
+        self._buf += data
+
+    def text(self, txt: str) -> None:
+        """Append text encoded for the printer."""
+        # ASCII is the same bytes in cp437, and the ascii codec is far faster
+        # than the charmap one; only names with accents etc. need the code page
+        if txt.isascii():
+            self._buf += txt.encode("ascii")
+        else:
+            self._buf += txt.encode(TEXT_ENCODING, "replace")
+
+    def getvalue(self) -> bytes:
+        """Return the buffered ESC/POS byte stream."""
+        return bytes(self._buf)
+
+
+# Start of every ESC/POS chit: init plus the large, bold, centred table-number style
+_CHIT_BANNER = EscposBuffer()
+_CHIT_BANNER.set(align='center', bold=True, width=2, height=2)
+
+
+# Settings fields printed in the receipt header, read in one call
+_restaurant_details = attrgetter(
+    "RESTAURANT_NAME",
+    "RESTAURANT_ADDRESS_LINE1",
+    "RESTAURANT_ADDRESS_LINE2",
+    "RESTAURANT_PHONE",
+    "RESTAURANT_EMAIL",
+    "RESTAURANT_GSTIN",
+)
+
+
+@lru_cache(maxsize=4)
+def _receipt_header(
+    is_58mm: bool,
+    restaurant_name: str,
+    address_line1: str,
+    address_line2: str,
+    phone: str,
+    email: str,
+    gstin: str,
+) -> EscposBuffer:
+    """
+    Build the restaurant header block of a receipt.
+
+    It is the same for every order, so it is built once per paper size and
+    settings values; callers copy() the result and append the order to it.
+    """
+    sep_eq = SEP_EQ_58 if is_58mm else SEP_EQ_80
+
+    buf = EscposBuffer()
+    buf.set(align='center', bold=True, width=2, height=2)
+
+    # ============================================================================
+    # HEADER SECTION
+    # ============================================================================
+
+    buf.text("LILY\n")
+    buf.set(align='center', bold=True, width=1, height=1)
+    buf.text(f"{restaurant_name.replace('Lily ', '')}\n")
+    buf.set(align='center', bold=False)
+    buf.text(f"{address_line1}\n")
+    buf.text(f"{address_line2}\n")
+
+    if is_58mm:
+        # Stack contact info for narrow paper
+        buf.text(f"Tel: {phone}\n")
+        buf.text(f"{email}\n")
+    else:
+        # Side by side for wider paper
+        buf.text(f"Tel: {phone} | {email}\n")
+
+    buf.text(f"GSTIN: {gstin}\n")
+    buf.text("\n")
+
+    # Separator
+    buf.set(align='center')
+    buf.raw(sep_eq)
+    buf.text("\n")
+    return buf
+
+
+# Receipts and chits queued by API requests are printed one at a time on a
+# background thread, so a request never waits on the printer
+_print_queue: queue.Queue = queue.Queue()
+_print_worker: Optional[threading.Thread] = None
+_print_worker_lock = threading.Lock()
+# How long shutdown waits for queued jobs before dropping the rest; one job on an
+# unreachable network printer alone can take escpos' 60 s socket timeout
+PRINT_QUEUE_SHUTDOWN_TIMEOUT = 10.0
+
+
+def _print_worker_loop() -> None:
+    """Run queued print jobs forever."""
+    while True:
+        job, args = _print_queue.get()
+        try:
+            job(*args)
+        except Exception as e:
+            logger.error("Background print job failed: %s", e, exc_info=True)
+        finally:
+            _print_queue.task_done()
+
+
+def _ensure_print_worker() -> None:
+    """Start the print worker thread on first use."""
+    global _print_worker
+    with _print_worker_lock:
+        if _print_worker is None or not _print_worker.is_alive():
+            _print_worker = threading.Thread(target=_print_worker_loop, name="print-worker", daemon=True)
+            _print_worker.start()
+
+
+def _snapshot_order(order: models.Order, items: Optional[list[models.OrderItem]] = None) -> SimpleNamespace:
+    """
+    Copy the order fields receipts and chits print, so a queued job never
+    touches the request's database session.
 
     Args:
-        order: Order model instance with order details
+        order: Order model instance
+        items: Items to include; defaults to all of the order's items
+    """
+    if items is None:
+        items = order.order_items
+    return SimpleNamespace(
+        order_number=order.order_number,
+        table_number=order.table_number,
+        customer_name=order.customer_name,
+        created_at=order.created_at,
+        subtotal=order.subtotal,
+        gst_amount=order.gst_amount,
+        total_amount=order.total_amount,
+        order_items=[
+            SimpleNamespace(
+                quantity=item.quantity,
+                menu_item_name=item.menu_item_name,
+                unit_price=item.unit_price,
+                subtotal=item.subtotal,
+                is_parcel=item.is_parcel,
+                is_beverage=item.is_beverage,
+            )
+            for item in items
+        ],
+    )
+
+
+def queue_receipt(order: models.Order) -> bool:
+    """
+    Queue a receipt to be printed in the background.
 
     Returns:
-        True if printing succeeded, False otherwise
+        True if the receipt was queued, False if printing is disabled
     """
     if not settings.PRINTER_ENABLED:
         logger.info("Printer disabled - skipping print")
         return False
 
-    printer = None
-    try:
-        printer = get_printer()
-        if not printer:
-            logger.warning("No printer configured")
-            return False
+    _ensure_print_worker()
+    _print_queue.put((print_receipt, (_snapshot_order(order),)))
+    return True
 
-        # Get paper width from settings
-        paper_size = settings.RECEIPT_PAPER_SIZE
-        is_58mm = paper_size == "58mm"
 
-        # Initialize printer
-        printer.set(align='center', bold=True, width=2, height=2)
+def queue_order_chit(order: models.Order, items_to_print: list[models.OrderItem] = None) -> bool:
+    """
+    Queue an order chit to be printed in the background.
 
-        # ============================================================================
-        # HEADER SECTION
-        # ============================================================================
+    Args:
+        order: Order model instance
+        items_to_print: Optional list of specific OrderItems to print (see print_order_chit)
+
+    Returns:
+        True if the chit was queued, False if printing is disabled
+    """
+    if not settings.PRINTER_ENABLED:
+        logger.info("Printer disabled - skipping order chit print")
+        return False
+
+    _ensure_print_worker()
+    snapshot = _snapshot_order(order, items_to_print)
+    _print_queue.put((print_order_chit, (snapshot, snapshot.order_items)))
+    return True
+
+
+def wait_for_print_queue(timeout: Optional[float] = None) -> bool:
+    """
+    Block until every queued print job has finished.
+
+    Args:
+        timeout: Seconds to wait at most; None waits indefinitely. When the
+            deadline passes, jobs still waiting in the queue are logged and
+            dropped. A job already running is left to finish on the worker.
+
+    Returns:
+        True if the queue drained, False if jobs were dropped
+    """
+    if timeout is None:
+        _print_queue.join()
+        return True
 
-        printer.text("LILY\n")
-        printer.set(align='center', bold=True, width=1, height=1)
-        printer.text(f"{settings.RESTAURANT_NAME.replace('Lily ', '')}\n")
-        printer.set(align='center', bold=False)
-        printer.text(f"{settings.RESTAURANT_ADDRESS_LINE1}\n")
-        printer.text(f"{settings.RESTAURANT_ADDRESS_LINE2}\n")
-
-        if is_58mm:
-            # Stack contact info for narrow paper
-            printer.text(f"Tel: {settings.RESTAURANT_PHONE}\n")
-            printer.text(f"{settings.RESTAURANT_EMAIL}\n")
+    deadline = time.monotonic() + timeout
+    with _print_queue.all_tasks_done:
+        while _print_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _print_queue.all_tasks_done.wait(remaining)
         else:
-            # Side by side for wider paper
-            printer.text(f"Tel: {settings.RESTAURANT_PHONE} | {settings.RESTAURANT_EMAIL}\n")
+            return True
 
-        printer.text(f"GSTIN: {settings.RESTAURANT_GSTIN}\n")
-        printer.text("\n")
+    dropped = 0
+    while True:
+        try:
+            _print_queue.get_nowait()
+        except queue.Empty:
+            break
+        _print_queue.task_done()
+        dropped += 1
+    logger.warning("Print queue not drained after %.0f s; dropped %d queued job(s)", timeout, dropped)
+    return False
 
-        # Separator
-        printer.set(align='center')
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
+
+def print_receipt(order: models.Order) -> bool:
+    """
+    Print receipt directly to thermal printer using ESC/POS commands.
+
+    Args:
+        order: Order model instance with order details
+
+    Returns:
+        True if printing succeeded, False otherwise
+    """
+    if not settings.PRINTER_ENABLED:
+        logger.info("Printer disabled - skipping print")
+        return False
+
+    try:
+        # Precomputed layout for the configured paper width
+        layout = RECEIPT_LAYOUTS.get(settings.RECEIPT_PAPER_SIZE, RECEIPT_LAYOUT_80)
+        is_58mm = layout.is_58mm
+        sep_dash = layout.sep_dash
+        w, aw = layout.name_width, layout.amount_width
+        name_max, name_trunc = layout.name_max, layout.name_trunc
+        rate_indent = layout.rate_indent
+
+        # Build the receipt in memory, starting from the cached restaurant header
+        buf = _receipt_header(is_58mm, *_restaurant_details(settings)).copy()
 
         # ============================================================================
         # ORDER INFORMATION
         # ============================================================================
 
-        printer.set(align='left', bold=True)
-        printer.text(f"Order No: {order.order_number}\n")
-        printer.set(bold=False)
-
-        # Format date/time
-        from app.utils.pdf_generator import convert_to_local_timezone
-        local_time = convert_to_local_timezone(order.created_at)
-        printer.text(f"Date: {local_time.strftime('%d-%m-%Y %I:%M %p')}\n")
+        buf.set(align='left', bold=True)
+        buf.text(f"Order No: {order.order_number}\n")
+        buf.set(bold=False)
 
+        # Date/time, customer and a blank line, encoded together
+        info = f"Date: {format_local_datetime(order.created_at, RECEIPT_DATETIME_FORMAT)}\n"
         if order.customer_name:
-            printer.text(f"Customer: {order.customer_name}\n")
-
-        printer.text("\n")
+            info += f"Customer: {order.customer_name}\n"
+        buf.text(info + "\n")
 
         # Table number (prominent)
-        printer.set(align='center', bold=True, width=2, height=1)
-        printer.text(f"Table {order.table_number}\n")
-        printer.set(align='left', bold=False, width=1, height=1)
-        printer.text("\n")
+        buf.set(align='center', bold=True, width=2, height=1)
+        buf.text(f"Table {order.table_number}\n")
+        buf.set(align='left', bold=False, width=1, height=1)
+        buf.text("\n")
 
         # Separator
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
+        buf.raw(sep_dash)
 
         # ============================================================================
         # ITEMS SECTION
         # ============================================================================
 
-        printer.set(bold=True)
-        if is_58mm:
-            printer.text(f"{'Item':<20} {'Amt':>11}\n")
-        else:
-            printer.text(f"{'Item':<28} {'Amount':>13}\n")
-        printer.set(bold=False)
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
+        buf.set(bold=True)
+        buf.text(layout.items_header)
+        buf.set(bold=False)
+        buf.raw(sep_dash)
 
+        lines = []
+        append = lines.append
+        fmt = format_currency
         for item in order.order_items:
             # Item name with quantity
             item_text = f"{item.quantity}x {item.menu_item_name}"
-            if len(item_text) > (20 if is_58mm else 28):
-                item_text = item_text[:(17 if is_58mm else 25)] + "..."
+            if len(item_text) > name_max:
+                item_text = item_text[:name_trunc] + "..."
 
-            amount_text = format_currency(item.subtotal)
+            # Amount row and unit-rate row in one string
+            append(f"{item_text.ljust(w)} {fmt(item.subtotal).rjust(aw)}\n{rate_indent}@ {fmt(item.unit_price)}\n")
 
-            if is_58mm:
-                printer.text(f"{item_text:<20} {amount_text:>11}\n")
-                
-                printer.text(f"  @ {format_currency(item.unit_price)}\n")
-            else:
-                printer.text(f"{item_text:<28} {amount_text:>13}\n")
-                printer.text(f"   @ {format_currency(item.unit_price)}\n")
-
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
+        buf.text("".join(lines))
+        buf.raw(sep_dash)
+        lines.clear()
 
         # ============================================================================
         # TOTALS SECTION
@@ -342,74 +807,149 @@ def print_receipt(order: models.Order) -> bool:
 
         # Subtotal
         subtotal_text = format_currency(order.subtotal)
-        if is_58mm:
-            printer.text(f"{'Subtotal:':<20} {subtotal_text:>11}\n")
-        else:
-            printer.text(f"{'Subtotal:':<28} {subtotal_text:>13}\n")
+        append(f"{'Subtotal:'.ljust(w)} {subtotal_text.rjust(aw)}\n")
 
         # GST breakdown
-        half_gst_rate = settings.GST_RATE / 2
         cgst_amount = order.gst_amount // 2
         sgst_amount = order.gst_amount - cgst_amount
+        cgst_label, sgst_label = _gst_row_labels(settings.GST_RATE, is_58mm)
 
-        cgst_text = format_currency(cgst_amount)
-        sgst_text = format_currency(sgst_amount)
-
-        if is_58mm:
-            printer.text(f"CGST ({half_gst_rate}%): {cgst_text:>11}\n")
-            printer.text(f"SGST ({half_gst_rate}%): {sgst_text:>11}\n")
-        else:
-            printer.text(f"{'CGST (' + str(half_gst_rate) + '%):':<28} {cgst_text:>13}\n")
-            printer.text(f"{'SGST (' + str(half_gst_rate) + '%):':<28} {sgst_text:>13}\n")
+        append(f"{cgst_label}{fmt(cgst_amount).rjust(aw)}\n")
+        append(f"{sgst_label}{fmt(sgst_amount).rjust(aw)}\n")
 
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
+        buf.text("".join(lines))
+        buf.raw(sep_dash)
 
         # Total (prominent)
         total_text = format_currency(order.total_amount)
-        printer.set(bold=True, width=1, height=2)
-        if is_58mm:
-            printer.text(f"{'TOTAL:':<20} {total_text:>11}\n")
-        else:
-            printer.text(f"{'TOTAL:':<28} {total_text:>13}\n")
-        printer.set(bold=False, width=1, height=1)
+        buf.set(bold=True, width=1, height=2)
+        buf.text(f"{'TOTAL:'.ljust(w)} {total_text.rjust(aw)}\n")
+        buf.set(bold=False, width=1, height=1)
 
-        printer.text("\n")
+        buf.text("\n")
 
         # ============================================================================
         # FOOTER SECTION
         # ============================================================================
 
-        printer.set(align='center')
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
-        printer.text("Thank you for visiting!\n")
-        printer.text("#withlovefrommary\n")
-        printer.text("\n\n")
+        buf.set(align='center')
+        buf.raw(layout.footer)
 
-        # Cut paper (if supported)
-        try:
-            printer.cut()
-        except:
-            # Some printers don't support cut, that's okay
-            printer.text("\n\n\n")
+        # Send the whole document in one write over the shared connection
+        if not _print_document(buf.getvalue()):
+            logger.warning("No printer configured")
+            return False
 
-        logger.info(f"Successfully printed receipt for order {order.order_number}")
+        logger.info("Successfully printed receipt for order %s", order.order_number)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to print receipt for order {order.order_number if order else 'unknown'}: {e}")
+        logger.error("Failed to print receipt for order %s: %s", order.order_number if order else "unknown", e)
         return False
 
-    finally:
-        # Close printer connection
-        if printer:
-            try:
-                printer.close()
-            except:
-                pass
+
+# Install locations probed for the external PDF print tools, in order of preference
+SUMATRA_PATHS = (
+    r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
+    r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
+    os.path.expandvars(r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe"),
+)
+GSPRINT_PATHS = (
+    r"C:\Program Files\Ghostgum\gsview\gsprint.exe",
+    r"C:\Program Files (x86)\Ghostgum\gsview\gsprint.exe",
+)
+ADOBE_PATHS = (
+    r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
+    r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+)
+
+
+@cache
+def _find_print_tool(candidates: tuple[str, ...]) -> Optional[str]:
+    """Return the first installed path among candidates (cached per process)."""
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def refresh_print_backend() -> None:
+    """Forget detected print tools, e.g. after installing SumatraPDF."""
+    _find_print_tool.cache_clear()
+
+
+# PowerShell print scripts are fixed text; the printer name and PDF path reach
+# them through environment variables, so neither is ever parsed as script
+POWERSHELL_COMMAND = ["powershell", "-NoProfile", "-NonInteractive", "-Command"]
+PS_PRINT_TO_SCRIPT = """
+$printer = Get-Printer -Name $env:PRN_NAME -ErrorAction SilentlyContinue
+if ($printer) {
+    Start-Process -FilePath $env:PDF_PATH -Verb PrintTo -ArgumentList ('"' + $env:PRN_NAME + '"') -WindowStyle Hidden
+    exit 0
+} else {
+    exit 1
+}
+"""
+PS_OUT_PRINTER_SCRIPT = "Get-Content -LiteralPath $env:PDF_PATH -Raw | Out-Printer -Name $env:PRN_NAME"
+
+
+def _powershell_env(pdf_path: str, printer_name: str) -> dict:
+    """Environment for the PowerShell print scripts."""
+    return {**os.environ, "PRN_NAME": printer_name, "PDF_PATH": pdf_path}
 
 
-def print_pdf_to_printer(pdf_path: str, printer_name: str = None) -> bool:
+def _watch_print_process(process: subprocess.Popen, label: str) -> None:
+    """Wait for a detached print command and log how it ended."""
+    try:
+        _, stderr = process.communicate(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        logger.error("%s print command timed out", label)
+        return
+
+    if process.returncode == 0:
+        logger.info("PDF printed successfully via %s", label)
+    else:
+        logger.warning("%s print failed: %s", label, stderr)
+
+
+def _start_print_process(args: list[str], label: str, env: Optional[dict] = None) -> None:
+    """Launch a print command without waiting; a daemon thread reaps it and logs the outcome."""
+    process = subprocess.Popen(
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, text=True, errors="replace"
+    )
+    threading.Thread(target=_watch_print_process, args=(process, label), daemon=True).start()
+
+
+def _print_via_sumatra(pdf_path: str, printer_name: str, fire_and_forget: bool) -> bool:
+    """Print with SumatraPDF, if installed (or launch it, when fire_and_forget)."""
+    sumatra_path = _find_print_tool(SUMATRA_PATHS)
+    if not sumatra_path:
+        return False
+
+    logger.info("Printing PDF using SumatraPDF to %s", printer_name)
+    args = [sumatra_path, "-print-to", printer_name, pdf_path]
+    try:
+        if fire_and_forget:
+            _start_print_process(args, "SumatraPDF")
+            return True
+        result = subprocess.run(args, capture_output=True, text=True, errors="replace", timeout=30)
+    except FileNotFoundError:
+        # Uninstalled since it was detected; look again next time
+        logger.warning("SumatraPDF no longer found at %s", sumatra_path)
+        refresh_print_backend()
+        return False
+
+    if result.returncode == 0:
+        logger.info("PDF printed successfully via SumatraPDF")
+        return True
+    logger.warning("SumatraPDF print failed: %s", result.stderr)
+    return False
+
+
+def print_pdf_to_printer(pdf_path: str, printer_name: str = None, fire_and_forget: bool = True) -> bool:
     """
     Print a PDF file to a thermal printer using system commands.
 
@@ -421,9 +961,12 @@ def print_pdf_to_printer(pdf_path: str, printer_name: str = None) -> bool:
     Args:
         pdf_path: Path to the PDF file to print
         printer_name: Name of the printer (uses PRINTER_NAME from settings if not provided)
+        fire_and_forget: Return as soon as the print command is launched; its
+                         result is logged in the background. Pass False to wait
+                         for it and fall back to the next method on failure.
 
     Returns:
-        True if printing succeeded, False otherwise
+        True if printing succeeded (or was launched), False otherwise
     """
     if printer_name is None:
         printer_name = settings.PRINTER_NAME
@@ -436,92 +979,8 @@ def print_pdf_to_printer(pdf_path: str, printer_name: str = None) -> bool:
         logger.error(f"PDF file not found: {pdf_path}")
         return False
 
-    system = platform.system()
-
     try:
-        if system == "Windows":
-            # Method 1: Try SumatraPDF (best for silent printing)
-            sumatra_paths = [
-                r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-                r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
-                os.path.expandvars(r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe"),
-            ]
-
-            for sumatra_path in sumatra_paths:
-                if os.path.exists(sumatra_path):
-                    logger.info(f"Printing PDF using SumatraPDF to {printer_name}")
-                    result = subprocess.run(
-                        [sumatra_path, "-print-to", printer_name, pdf_path],
-                        capture_output=True,
-                        timeout=30
-                    )
-                    if result.returncode == 0:
-                        logger.info("PDF printed successfully via SumatraPDF")
-                        return True
-                    else:
-                        logger.warning(f"SumatraPDF print failed: {result.stderr.decode()}")
-
-            # Method 2: Use Windows shell print command via PowerShell
-            logger.info("Trying Windows print command via PowerShell")
-            ps_command = f'''
-            $printer = Get-Printer -Name "{printer_name}" -ErrorAction SilentlyContinue
-            if ($printer) {{
-                Start-Process -FilePath "{pdf_path}" -Verb PrintTo -ArgumentList '"{printer_name}"' -WindowStyle Hidden
-                exit 0
-            }} else {{
-                exit 1
-            }}
-            '''
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                logger.info("PDF sent to printer via PowerShell")
-                return True
-            else:
-                logger.warning(f"PowerShell print failed: {result.stderr.decode()}")
-
-            # Method 3: Use win32print library if available
-            try:
-                import win32print
-                import win32api
-
-                logger.info("Trying win32print library")
-                win32api.ShellExecute(
-                    0,
-                    "printto",
-                    pdf_path,
-                    f'"{printer_name}"',
-                    ".",
-                    0
-                )
-                logger.info("PDF sent to printer via win32print")
-                return True
-            except ImportError:
-                logger.warning("win32print library not available")
-            except Exception as e:
-                logger.warning(f"win32print failed: {e}")
-
-        elif system == "Linux":
-            # Linux: Use CUPS lp command
-            logger.info(f"Printing PDF using lp command to {printer_name}")
-            result = subprocess.run(
-                ["lp", "-d", printer_name, pdf_path],
-                capture_output=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                logger.info("PDF printed successfully via lp")
-                return True
-            else:
-                logger.error(f"lp command failed: {result.stderr.decode()}")
-                return False
-
-        else:
-            logger.error(f"Unsupported operating system for PDF printing: {system}")
-            return False
+        return _PDF_PRINT_BACKEND(pdf_path, printer_name, fire_and_forget)
 
     except subprocess.TimeoutExpired:
         logger.error("Print command timed out")
@@ -530,84 +989,205 @@ def print_pdf_to_printer(pdf_path: str, printer_name: str = None) -> bool:
         logger.error(f"Failed to print PDF: {e}")
         return False
 
+
+def _print_pdf_windows(pdf_path: str, printer_name: str, fire_and_forget: bool) -> bool:
+    """SumatraPDF first, then PowerShell, then the shell printto verb."""
+    # Method 1: Try SumatraPDF (best for silent printing)
+    if _print_via_sumatra(pdf_path, printer_name, fire_and_forget):
+        return True
+
+    # Method 2: Use Windows shell print command via PowerShell
+    logger.info("Trying Windows print command via PowerShell")
+    ps_env = _powershell_env(pdf_path, printer_name)
+    if fire_and_forget:
+        _start_print_process(POWERSHELL_COMMAND + [PS_PRINT_TO_SCRIPT], "PowerShell", env=ps_env)
+        return True
+    result = subprocess.run(
+        POWERSHELL_COMMAND + [PS_PRINT_TO_SCRIPT],
+        capture_output=True,
+        text=True,
+        errors="replace",
+        timeout=30,
+        env=ps_env
+    )
+    if result.returncode == 0:
+        logger.info("PDF sent to printer via PowerShell")
+        return True
+    else:
+        logger.warning("PowerShell print failed: %s", result.stderr)
+
+    # Method 3: Use win32print library if available
+    try:
+        import win32print
+        import win32api
+
+        logger.info("Trying win32print library")
+        win32api.ShellExecute(
+            0,
+            "printto",
+            pdf_path,
+            f'"{printer_name}"',
+            ".",
+            0
+        )
+        logger.info("PDF sent to printer via win32print")
+        return True
+    except ImportError:
+        logger.warning("win32print library not available")
+    except Exception as e:
+        logger.warning(f"win32print failed: {e}")
+
     # If we got here, all methods failed
     logger.error("All PDF printing methods failed")
     return False
 
 
-def _auto_print_pdf(pdf_path: str, printer_name: str) -> bool:
+def _print_pdf_linux(pdf_path: str, printer_name: str, fire_and_forget: bool) -> bool:
+    """Print through CUPS with the lp command."""
+    logger.info("Printing PDF using lp command to %s", printer_name)
+    if fire_and_forget:
+        _start_print_process(["lp", "-d", printer_name, pdf_path], "lp")
+        return True
+    result = subprocess.run(
+        ["lp", "-d", printer_name, pdf_path],
+        capture_output=True,
+        text=True,
+        errors="replace",
+        timeout=30
+    )
+    if result.returncode == 0:
+        logger.info("PDF printed successfully via lp")
+        return True
+    else:
+        logger.error("lp command failed: %s", result.stderr)
+        return False
+
+
+def _print_pdf_unsupported(pdf_path: str, printer_name: str, fire_and_forget: bool) -> bool:
+    """No PDF print command is known for this OS."""
+    logger.error(f"Unsupported operating system for PDF printing: {_SYSTEM}")
+    return False
+
+
+# Picked once at import instead of branching on the OS per print
+_PDF_PRINT_BACKEND = {
+    "Windows": _print_pdf_windows,
+    "Linux": _print_pdf_linux,
+}.get(_SYSTEM, _print_pdf_unsupported)
+
+
+def print_pdf_stream_to_printer(pdf_bytes: bytes, printer_name: str = None) -> bool:
     """
-    Automatically print a PDF file to the specified printer.
-    Tries multiple methods to ensure printing works.
+    Print an in-memory PDF, skipping the temporary file where possible.
+
+    On Linux the PDF is piped to `lp` on stdin. Windows print tools need a
+    file path, so there it is written to a temporary file, printed with
+    print_pdf_to_printer() and removed.
 
     Args:
-        pdf_path: Path to the PDF file
-        printer_name: Name of the printer
+        pdf_bytes: Complete PDF document
+        printer_name: Name of the printer (uses PRINTER_NAME from settings if not provided)
 
     Returns:
         True if printing succeeded, False otherwise
     """
+    if printer_name is None:
+        printer_name = settings.PRINTER_NAME
+
     if not printer_name:
-        logger.warning("No printer name provided for auto-print")
+        logger.error("No printer name configured for PDF printing")
         return False
 
-    # Method 1: Try GSPrint or Ghostscript (if installed)
+    if _SYSTEM != "Linux":
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
+            tmp_file.write(pdf_bytes)
+        try:
+            return print_pdf_to_printer(tmp_file.name, printer_name, fire_and_forget=False)
+        finally:
+            os.remove(tmp_file.name)
+
     try:
-        gsprint_paths = [
-            r"C:\Program Files\Ghostgum\gsview\gsprint.exe",
-            r"C:\Program Files (x86)\Ghostgum\gsview\gsprint.exe",
-        ]
-        for gsprint_path in gsprint_paths:
-            if os.path.exists(gsprint_path):
-                logger.info(f"Trying GSPrint: {gsprint_path}")
-                result = subprocess.run(
-                    [gsprint_path, "-printer", printer_name, pdf_path],
-                    capture_output=True,
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    logger.info("✓ Printed via GSPrint")
-                    return True
+        logger.info("Printing PDF using lp command to %s", printer_name)
+        result = subprocess.run(
+            ["lp", "-d", printer_name],
+            input=pdf_bytes,
+            capture_output=True,
+            timeout=30
+        )
+        if result.returncode == 0:
+            logger.info("PDF printed successfully via lp")
+            return True
+        # The PDF goes in as bytes, so stderr comes back as bytes too
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("lp command failed: %s", result.stderr.decode(errors="replace"))
+        return False
+
+    except subprocess.TimeoutExpired:
+        logger.error("Print command timed out")
+        return False
+    except Exception as e:
+        logger.error(f"Failed to print PDF: {e}")
+        return False
+
+
+def _print_via_gsprint(pdf_path: str, printer_name: str) -> bool:
+    """Print with GSPrint/Ghostscript, if installed."""
+    try:
+        gsprint_path = _find_print_tool(GSPRINT_PATHS)
+        if gsprint_path:
+            logger.info(f"Trying GSPrint: {gsprint_path}")
+            result = subprocess.run(
+                [gsprint_path, "-printer", printer_name, pdf_path],
+                capture_output=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                logger.info("✓ Printed via GSPrint")
+                return True
     except Exception as e:
         logger.debug(f"GSPrint not available: {e}")
+    return False
+
 
-    # Method 2: Try Adobe Reader command line (if installed)
+def _print_via_adobe(pdf_path: str, printer_name: str) -> bool:
+    """Print with the Adobe Reader command line, if installed."""
     try:
-        adobe_paths = [
-            r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
-            r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-            r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-        ]
-        for adobe_path in adobe_paths:
-            if os.path.exists(adobe_path):
-                logger.info(f"Trying Adobe Reader: {adobe_path}")
-                result = subprocess.run(
-                    [adobe_path, "/t", pdf_path, printer_name],
-                    capture_output=True,
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    logger.info("✓ Printed via Adobe Reader")
-                    return True
+        adobe_path = _find_print_tool(ADOBE_PATHS)
+        if adobe_path:
+            logger.info(f"Trying Adobe Reader: {adobe_path}")
+            result = subprocess.run(
+                [adobe_path, "/t", pdf_path, printer_name],
+                capture_output=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                logger.info("✓ Printed via Adobe Reader")
+                return True
     except Exception as e:
         logger.debug(f"Adobe Reader not available: {e}")
+    return False
+
 
-    # Method 3: Try PowerShell with Out-Printer
+def _print_via_powershell(pdf_path: str, printer_name: str) -> bool:
+    """Print with PowerShell Out-Printer."""
     try:
         logger.info("Trying PowerShell Out-Printer")
-        ps_command = f'Get-Content "{pdf_path}" -Raw | Out-Printer -Name "{printer_name}"'
         result = subprocess.run(
-            ["powershell", "-Command", ps_command],
+            POWERSHELL_COMMAND + [PS_OUT_PRINTER_SCRIPT],
             capture_output=True,
-            timeout=10
+            timeout=10,
+            env=_powershell_env(pdf_path, printer_name)
         )
         if result.returncode == 0:
             logger.info("✓ Printed via PowerShell")
             return True
     except Exception as e:
         logger.debug(f"PowerShell printing failed: {e}")
+    return False
+
 
-    # Method 4: Try using default Windows print handler
+def _print_via_shell_execute(pdf_path: str, printer_name: str) -> bool:
+    """Hand the PDF to the default Windows print handler."""
     try:
         logger.info("Trying Windows ShellExecute print verb")
         import win32api
@@ -623,7 +1203,50 @@ def _auto_print_pdf(pdf_path: str, printer_name: str) -> bool:
         return True
     except Exception as e:
         logger.debug(f"ShellExecute print failed: {e}")
+    return False
+
+
+# Auto-print methods in order of preference
+AUTO_PRINT_METHODS = (
+    ("gsprint", _print_via_gsprint),
+    ("adobe", _print_via_adobe),
+    ("powershell", _print_via_powershell),
+    ("shell_execute", _print_via_shell_execute),
+)
+
+# Name of the method that last printed successfully; tried first next time
+_auto_print_method: Optional[str] = None
+
+
+def _auto_print_pdf(pdf_path: str, printer_name: str) -> bool:
+    """
+    Automatically print a PDF file to the specified printer.
+    Tries multiple methods to ensure printing works, starting with the
+    method that worked last time so failing ones are not re-run per print.
+
+    Args:
+        pdf_path: Path to the PDF file
+        printer_name: Name of the printer
+
+    Returns:
+        True if printing succeeded, False otherwise
+    """
+    global _auto_print_method
+
+    if not printer_name:
+        logger.warning("No printer name provided for auto-print")
+        return False
+
+    methods = AUTO_PRINT_METHODS
+    if _auto_print_method is not None:
+        methods = sorted(methods, key=lambda method: method[0] != _auto_print_method)
 
+    for name, print_method in methods:
+        if print_method(pdf_path, printer_name):
+            _auto_print_method = name
+            return True
+
+    _auto_print_method = None
     logger.error("All auto-print methods failed")
     return False
 
@@ -664,51 +1287,117 @@ def print_order_chit(order: models.Order, items_to_print: list[models.OrderItem]
 
     try:
         item_count = len(items_to_print)
-        logger.info(f"Generating order chit for table {order.table_number}, order {order.order_number} ({item_count} items)")
+        logger.info("Generating order chit for table %s, order %s (%d items)", order.table_number, order.order_number, item_count)
 
-        # Separate items into kitchen, bar, and parcel
-        kitchen_items = [item for item in items_to_print if not item.is_parcel and not item.is_beverage]
-        bar_items = [item for item in items_to_print if not item.is_parcel and item.is_beverage]
-        parcel_items = [item for item in items_to_print if item.is_parcel]
+        # Separate items into kitchen, bar, and parcel in one pass
+        kitchen_items, bar_items, parcel_items = [], [], []
+        for item in items_to_print:
+            if item.is_parcel:
+                parcel_items.append(item)
+            elif item.is_beverage:
+                bar_items.append(item)
+            else:
+                kitchen_items.append(item)
 
-        success = True
+        stations = [
+            (station, items)
+            for station, items in (("kitchen", kitchen_items), ("bar", bar_items), ("parcel", parcel_items))
+            if items
+        ]
 
-        def _print_chit_with_pdf(items, station: str):
-            nonlocal success
-            if not items:
-                return
-            label = station.upper()
-            logger.info(f"Printing {label} chit for table {order.table_number} ({len(items)} items)")
-
-            # Generate PDF for records
-            try:
-                from app.utils.pdf_generator import generate_order_chit_pdf
-                chits_dir = os.path.join(os.getcwd(), "chits")
-                os.makedirs(chits_dir, exist_ok=True)
-                pdf_filename = f"Table_{order.table_number}_{order.order_number}_{label}.pdf"
-                pdf_path = os.path.join(chits_dir, pdf_filename)
-
-                with open(pdf_path, "wb") as pdf_file:
-                    generate_order_chit_pdf(order, pdf_file, paper_size=paper_size, items_to_print=items, station=station)
-                logger.info(f"✓ PDF saved to: {pdf_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save PDF copy: {e}")
-
-            if not _print_order_chit_escpos(order, items, paper_size, station=station):
-                success = False
+        # Order time, formatted once for every station's ticket and PDF
+        time_text = format_local_datetime(order.created_at, CHIT_TIME_FORMAT)
+
+        # Queue every record PDF before printing, so the background worker renders
+        # them while the tickets go out over ESC/POS
+        for station, items in stations:
+            order_copy, items_copy = _snapshot_chit(order, items)
+            _chit_pdf_executor.submit(_save_chit_pdf, order_copy, items_copy, paper_size, station, time_text)
 
-        _print_chit_with_pdf(kitchen_items, "kitchen")
-        _print_chit_with_pdf(bar_items, "bar")
-        _print_chit_with_pdf(parcel_items, "parcel")
+        success = True
+        for station, items in stations:
+            logger.info("Printing %s chit for table %s (%d items)", station.upper(), order.table_number, len(items))
+            if not _print_order_chit_escpos(order, items, paper_size, station=station, time_text=time_text):
+                success = False
 
         return success
 
     except Exception as e:
-        logger.error(f"Failed to print order chit: {e}", exc_info=True)
+        logger.error("Failed to print order chit: %s", e, exc_info=True)
+        return False
+
+
+def print_combined_order_chit(order: models.Order) -> bool:
+    """
+    Print one chit with every item of the order over ESC/POS.
+
+    The raw-printer counterpart of chit_generator's combined PDF chit: no
+    kitchen/bar/parcel split, no station footer and no record PDF.
+
+    Returns:
+        True if printing succeeded, False otherwise
+    """
+    if not settings.PRINTER_ENABLED:
+        logger.info("Printer disabled - skipping order chit print")
         return False
 
+    paper_size = settings.RECEIPT_PAPER_SIZE
+    if paper_size not in ["58mm", "80mm"]:
+        paper_size = "80mm"  # Default to 80mm if invalid
+
+    logger.info("Printing combined chit for table %s, order %s", order.table_number, order.order_number)
+    return _print_order_chit_escpos(order, order.order_items, paper_size, station=None)
+
+
+def _snapshot_chit(order: models.Order, items: list[models.OrderItem]):
+    """
+    Copy the fields the chit PDF needs so it can be rendered after the
+    request's database session has closed.
+    """
+    order_copy = SimpleNamespace(
+        order_number=order.order_number,
+        table_number=order.table_number,
+        customer_name=order.customer_name,
+        created_at=order.created_at,
+    )
+    items_copy = [
+        SimpleNamespace(quantity=item.quantity, menu_item_name=item.menu_item_name)
+        for item in items
+    ]
+    return order_copy, items_copy
+
+
+@lru_cache(maxsize=8)
+def _ensure_dir(path: str) -> None:
+    """Create a directory on first use only; a failure isn't cached, so it is retried."""
+    os.makedirs(path, exist_ok=True)
+
+
+def _save_chit_pdf(order, items: list, paper_size: str, station: str, time_text: Optional[str] = None) -> None:
+    """Render a chit PDF in memory and write it to CHITS_DIR in one call."""
+    try:
+        pdf_buffer = BytesIO()
+        generate_order_chit_pdf(
+            order, pdf_buffer, paper_size=paper_size, items_to_print=items, station=station, time_text=time_text
+        )
+        pdf_filename = f"Table_{order.table_number}_{order.order_number}_{station.upper()}.pdf"
+        _ensure_dir(CHITS_DIR)
+        pdf_path = os.path.join(CHITS_DIR, pdf_filename)
+
+        with open(pdf_path, "wb", buffering=0) as pdf_file:
+            pdf_file.write(pdf_buffer.getvalue())
+        logger.info("✓ PDF saved to: %s", pdf_path)
+    except Exception as e:
+        logger.warning("Failed to save PDF copy: %s", e)
+
 
-def _print_order_chit_escpos(order: models.Order, items_to_print: list[models.OrderItem], paper_size: str = "80mm", station: str = "kitchen") -> bool:
+def _print_order_chit_escpos(
+    order: models.Order,
+    items_to_print: list[models.OrderItem],
+    paper_size: str = "80mm",
+    station: Optional[str] = "kitchen",
+    time_text: Optional[str] = None,
+) -> bool:
     """
     Print order chit using ESC/POS commands.
 
@@ -716,47 +1405,40 @@ def _print_order_chit_escpos(order: models.Order, items_to_print: list[models.Or
         order: Order model instance
         items_to_print: List of OrderItems to print on the chit
         paper_size: Paper size (58mm or 80mm)
-        station: "kitchen", "bar", or "parcel"
+        station: "kitchen", "bar", or "parcel"; None prints no station footer
+        time_text: Pre-formatted order time, shared across an order's station chits
 
     Returns:
         True if printing succeeded, False otherwise
     """
-    printer = None
     try:
-        printer = get_printer()
-        if not printer:
-            logger.warning("No printer configured for ESC/POS")
-            return False
-
-        is_58mm = paper_size == "58mm"
+        layout = CHIT_LAYOUTS.get(paper_size, CHIT_LAYOUTS["80mm"])
+        sep_eq = layout.sep_eq
 
         # ============================================================================
         # HEADER - Table Number (LARGE and CLEAR!)
         # ============================================================================
 
-        # Print table number in large, bold text
-        printer.set(align='center', bold=True, width=2, height=2)
-        printer.text(f"TABLE {order.table_number}\n")
+        # Print table number in large, bold text, from the prebuilt banner style
+        buf = _CHIT_BANNER.copy()
+        buf.text(f"TABLE {order.table_number}\n")
 
         # Reset to normal
-        printer.set(bold=False, width=1, height=1)
-        printer.text("\n")
+        buf.set(bold=False, width=1, height=1)
+        buf.text("\n")
 
         # Order info
-        from app.utils.pdf_generator import convert_to_local_timezone
-        local_time = convert_to_local_timezone(order.created_at)
-        printer.text(f"Order: {order.order_number}\n")
-        printer.text(f"Time: {local_time.strftime('%I:%M %p')}\n")
-
+        if time_text is None:
+            time_text = format_local_datetime(order.created_at, CHIT_TIME_FORMAT)
+        info = f"Order: {order.order_number}\nTime: {time_text}\n"
         if order.customer_name:
-            printer.text(f"Name: {order.customer_name}\n")
-
-        printer.text("\n")
+            info += f"Name: {order.customer_name}\n"
+        buf.text(info + "\n")
 
         # Separator
-        printer.set(align='center')
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
+        buf.set(align='center')
+        buf.raw(sep_eq)
+        buf.text("\n")
 
         # ============================================================================
         # ITEMS SECTION - Large, readable text (NO PRICES)
@@ -765,71 +1447,54 @@ def _print_order_chit_escpos(order: models.Order, items_to_print: list[models.Or
         for item in items_to_print:
             # Format beverages differently (underlined) to distinguish from food
             if item.is_beverage:
-                printer.set(align='left', bold=True, underline=True, width=2, height=2)
+                buf.set(align='left', bold=True, underline=True, width=2, height=2)
             else:
-                printer.set(align='left', bold=True, underline=False, width=2, height=2)
+                buf.set(align='left', bold=True, underline=False, width=2, height=2)
 
-            # Item with large quantity (NO PRICE - kitchen doesn't need it)
-            printer.text(f"{item.quantity}x {item.menu_item_name}\n")
-            printer.text("\n")  # Blank line for spacing
+            # Item with large quantity (NO PRICE - kitchen doesn't need it),
+            # followed by a blank line for spacing
+            buf.text(f"{item.quantity}x {item.menu_item_name}\n\n")
 
         # Reset to normal
-        printer.set(bold=False, underline=False, width=1, height=1)
+        buf.set(bold=False, underline=False, width=1, height=1)
 
         # Separator
-        printer.set(align='center')
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
+        buf.set(align='center')
+        buf.raw(sep_eq)
+        buf.text("\n")
 
         # ============================================================================
         # NOTES SECTION - Space for handwritten notes
         # ============================================================================
 
-        printer.set(align='left')
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
-        printer.text("NOTES:\n")
-        printer.text("\n")
-        printer.text("\n")
-        printer.text("\n")
-        printer.text("\n")
-        printer.text("\n")
-        printer.text("-" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
+        buf.set(align='left')
+        buf.raw(layout.notes)
 
         # ============================================================================
         # STATION IDENTIFIER - Show at bottom
         # ============================================================================
-        station_label = station.upper()
-        printer.set(align='center')
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.set(bold=True, width=2, height=2)
-        printer.text(f"{station_label}\n")
-        printer.set(bold=False, width=1, height=1)
-        printer.text("=" * (32 if is_58mm else 42) + "\n")
-        printer.text("\n")
-
-        # Cut paper (if supported)
-        try:
-            printer.cut()
-        except:
-            # Some printers don't support cut, that's okay
-            printer.text("\n\n\n")
+        if station is not None:
+            station_label = station.upper()
+            buf.set(align='center')
+            buf.raw(sep_eq)
+            buf.set(bold=True, width=2, height=2)
+            buf.text(f"{station_label}\n")
+            buf.set(bold=False, width=1, height=1)
+            buf.raw(sep_eq)
+            buf.text("\n")
+
+        # Send the whole document in one write over the shared connection
+        if not _print_document(buf.getvalue()):
+            logger.warning("No printer configured for ESC/POS")
+            return False
 
-        logger.info(f"Successfully printed ESC/POS order chit for table {order.table_number}")
+        logger.info("Successfully printed ESC/POS order chit for table %s", order.table_number)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to print ESC/POS order chit: {e}")
+        logger.error("Failed to print ESC/POS order chit: %s", e)
         return False
 
-    finally:
-        # Close printer connection
-        if printer:
-            try:
-                printer.close()
-            except:
-                pass
-
 
 def test_printer() -> bool:
     """
@@ -842,41 +1507,31 @@ def test_printer() -> bool:
         logger.info("Printer is disabled")
         return False
 
-    printer = None
+    # Reconnect so the test reflects the current configuration
+    reset_printer()
+
     try:
-        printer = get_printer()
-        if not printer:
+        # Print test page
+        buf = EscposBuffer()
+        buf.set(align='center', bold=True, width=2, height=2)
+        buf.text("TEST RECEIPT\n")
+        buf.set(bold=False, width=1, height=1)
+        buf.text("\n")
+        buf.text(f"{settings.RESTAURANT_NAME}\n")
+        buf.text("\n")
+        buf.text("Printer Test Successful!\n")
+        buf.text(f"Time: {datetime.now().strftime(TEST_PAGE_TIME_FORMAT)}\n")
+        buf.text("\n")
+        buf.raw(SEP_EQ_80)
+        buf.text("\n\n")
+
+        if not _print_document(buf.getvalue()):
             logger.warning("No printer configured")
             return False
 
-        # Print test page
-        printer.set(align='center', bold=True, width=2, height=2)
-        printer.text("TEST RECEIPT\n")
-        printer.set(bold=False, width=1, height=1)
-        printer.text("\n")
-        printer.text(f"{settings.RESTAURANT_NAME}\n")
-        printer.text("\n")
-        printer.text("Printer Test Successful!\n")
-        printer.text(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        printer.text("\n")
-        printer.text("=" * 42 + "\n")
-        printer.text("\n\n")
-
-        try:
-            printer.cut()
-        except:
-            printer.text("\n\n\n")
-
         logger.info("Printer test successful")
         return True
 
     except Exception as e:
         logger.error(f"Printer test failed: {e}")
         return False
-
-    finally:
-        if printer:
-            try:
-                printer.close()
-            except:
-                pass
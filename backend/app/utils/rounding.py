@@ -19,9 +19,8 @@ def round_to_nearest_rupee(amount_in_paise: int) -> int:
         round_to_nearest_rupee(15750) -> 15800  # ₹157.50 -> ₹158
         round_to_nearest_rupee(15751) -> 15800  # ₹157.51 -> ₹158
     """
-    rupees = amount_in_paise / 100
-    rounded_rupees = round(rupees)  # Standard rounding: 0.5+ rounds up
-    return int(rounded_rupees * 100)
+    # Integer arithmetic: 0.5+ rounds up (round() on a float would round half to even)
+    return (amount_in_paise + 50) // 100 * 100
 
 
 def round_down_to_rupee(amount_in_paise: int) -> int:
@@ -39,9 +38,7 @@ def round_down_to_rupee(amount_in_paise: int) -> int:
         round_down_to_rupee(15750) -> 15700  # ₹157.50 -> ₹157
         round_down_to_rupee(15799) -> 15700  # ₹157.99 -> ₹157
     """
-    rupees = amount_in_paise / 100
-    rounded_rupees = int(rupees)  # Floor division
-    return int(rounded_rupees * 100)
+    return amount_in_paise // 100 * 100  # Floor division, no float round-trip
 
 
 def calculate_rounding_adjustment(original: int, rounded: int) -> int:
@@ -7,15 +7,21 @@ Based on latest python-escpos library
 import sys
 import platform
 import io
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Rules for the console report and the 58mm test prints
+CONSOLE_RULE = "=" * 70
+PRINT_RULE = "=" * 32 + "\n"
 
 # Fix Windows console encoding for Unicode characters
 if platform.system() == "Windows":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-print("=" * 70)
+print(CONSOLE_RULE)
 print("ESSAE POS-60C THERMAL PRINTER DETECTION")
-print("=" * 70)
+print(CONSOLE_RULE)
 print(f"Platform: {platform.system()}")
 print()
 
@@ -46,10 +52,10 @@ if platform.system() == "Windows":
                 try:
                     print("   Testing connection...")
                     p = Win32Raw(printer_name)
-                    p.text("=" * 32 + "\n")
+                    p.text(PRINT_RULE)
                     p.text("  LILY CAFE POS SYSTEM\n")
                     p.text("  Printer Test\n")
-                    p.text("=" * 32 + "\n")
+                    p.text(PRINT_RULE)
                     p.text("\n")
                     p.text("Printer connected successfully!\n")
                     p.text(f"Printer: {printer_name}\n")
@@ -61,12 +67,12 @@ if platform.system() == "Windows":
 
                     print("   ✅ TEST PRINT SUCCESSFUL!")
                     print()
-                    print("=" * 70)
+                    print(CONSOLE_RULE)
                     print("CONFIGURATION FOR .env FILE:")
-                    print("=" * 70)
+                    print(CONSOLE_RULE)
                     print(f'PRINTER_TYPE=win32')
                     print(f'PRINTER_NAME={printer_name}')
-                    print("=" * 70)
+                    print(CONSOLE_RULE)
                     detected = True
                     break
 
@@ -93,16 +99,28 @@ if platform.system() == "Windows":
 print("[2/3] Checking USB printers...")
 try:
     from escpos.printer import Usb
-    import usb.core
+
+    def list_usb_devices():
+        """Return (vendor ID, product ID) for every connected USB device."""
+        if platform.system() == "Linux":
+            # sysfs already exposes the IDs: plain file reads, no libusb
+            # enumeration and no device permissions needed
+            return [
+                (int(vendor_file.read_text(), 16), int((vendor_file.parent / "idProduct").read_text(), 16))
+                for vendor_file in sorted(Path("/sys/bus/usb/devices").glob("*/idVendor"))
+            ]
+
+        import usb.core
+        return [(device.idVendor, device.idProduct) for device in usb.core.find(find_all=True)]
 
     # List all USB devices first
     print("Scanning USB devices...")
-    devices = list(usb.core.find(find_all=True))
+    devices = list_usb_devices()
 
     if devices:
         print(f"Found {len(devices)} USB device(s):")
-        for device in devices:
-            print(f"  Vendor: {hex(device.idVendor)}, Product: {hex(device.idProduct)}")
+        for vid, pid in devices:
+            print(f"  Vendor: {hex(vid)}, Product: {hex(pid)}")
     else:
         print("No USB devices found")
 
@@ -117,50 +135,65 @@ try:
         0x1a86,  # CH340 USB-to-Serial (common in Chinese printers)
     ]
 
-    for vid in vendor_ids:
+    # Index the devices found above by vendor ID (first match wins, as with
+    # usb.core.find) so each probe doesn't re-enumerate the whole bus
+    products_by_vendor = {}
+    for vid, pid in devices:
+        products_by_vendor.setdefault(vid, pid)
+
+    def open_usb(vid, pid):
+        """Open the device and release it again; raises if it can't be claimed."""
+        p = Usb(vid, pid, 0, profile="POS-5890")
+        p.open()
+        p.close()
+
+    def print_usb_test(vid, pid):
+        """Print the USB test page on the device."""
+        # Try with default endpoints
+        p = Usb(vid, pid, 0, profile="POS-5890")
+
+        p.text(PRINT_RULE)
+        p.text("  LILY CAFE POS SYSTEM\n")
+        p.text("  USB Printer Test\n")
+        p.text(PRINT_RULE)
+        p.text("\n")
+        p.text("USB connection successful!\n")
+        p.text(f"Vendor ID: {hex(vid)}\n")
+        p.text(f"Product ID: {hex(pid)}\n")
+        p.text("\n")
+        p.cut()
+        p.close()
+
+    # Open every connected candidate at once, then send the test page only to
+    # the first that opened, in vendor_ids priority order
+    candidates = [(vid, products_by_vendor[vid]) for vid in vendor_ids if vid in products_by_vendor]
+    with ThreadPoolExecutor(max_workers=max(len(candidates), 1)) as pool:
+        checks = [pool.submit(open_usb, vid, pid) for vid, pid in candidates]
+
+    for (vid, pid), check in zip(candidates, checks, strict=True):
+        print(f"\n✅ Found USB device: Vendor={hex(vid)}, Product={hex(pid)}")
+
+        # Try to connect and print
         try:
-            # Try to find device with this vendor ID
-            device = usb.core.find(idVendor=vid)
-            if device:
-                print(f"\n✅ Found USB device: Vendor={hex(vid)}, Product={hex(device.idProduct)}")
-
-                # Try to connect and print
-                try:
-                    print("   Testing connection...")
-                    # Try with default endpoints
-                    p = Usb(vid, device.idProduct, 0, profile="POS-5890")
-
-                    p.text("=" * 32 + "\n")
-                    p.text("  LILY CAFE POS SYSTEM\n")
-                    p.text("  USB Printer Test\n")
-                    p.text("=" * 32 + "\n")
-                    p.text("\n")
-                    p.text("USB connection successful!\n")
-                    p.text(f"Vendor ID: {hex(vid)}\n")
-                    p.text(f"Product ID: {hex(device.idProduct)}\n")
-                    p.text("\n")
-                    p.cut()
-                    p.close()
-
-                    print("   ✅ TEST PRINT SUCCESSFUL!")
-                    print()
-                    print("=" * 70)
-                    print("CONFIGURATION FOR .env FILE:")
-                    print("=" * 70)
-                    print(f'PRINTER_TYPE=usb')
-                    print(f'PRINTER_VENDOR_ID={hex(vid)}')
-                    print(f'PRINTER_PRODUCT_ID={hex(device.idProduct)}')
-                    print("=" * 70)
-                    detected = True
-                    break
-
-                except Exception as e:
-                    print(f"   ❌ Failed to print: {e}")
-                    continue
-
+            print("   Testing connection...")
+            check.result()
+            print_usb_test(vid, pid)
         except Exception as e:
+            print(f"   ❌ Failed to print: {e}")
             continue
 
+        print("   ✅ TEST PRINT SUCCESSFUL!")
+        print()
+        print(CONSOLE_RULE)
+        print("CONFIGURATION FOR .env FILE:")
+        print(CONSOLE_RULE)
+        print(f'PRINTER_TYPE=usb')
+        print(f'PRINTER_VENDOR_ID={hex(vid)}')
+        print(f'PRINTER_PRODUCT_ID={hex(pid)}')
+        print(CONSOLE_RULE)
+        detected = True
+        break
+
     if not detected:
         print("❌ No USB thermal printer detected or accessible")
 
@@ -183,61 +216,93 @@ try:
     # List available COM ports
     ports = list(serial.tools.list_ports.comports())
 
+    baudrates = [9600, 19200, 38400, 115200]
+
+    def open_serial(port_device, baudrate):
+        """Return a Serial printer on the port at this baud rate (not yet opened)."""
+        return Serial(
+            devfile=port_device,
+            baudrate=baudrate,
+            bytesize=8,
+            parity='N',
+            stopbits=1,
+            timeout=1.0,
+            profile="POS-5890"
+        )
+
+    def check_serial(port_device):
+        """Return the first baud rate the port opens at (closing it again), or None."""
+
+        # A port can only be opened once, so its baud rates are tried in turn
+        for baudrate in baudrates:
+            try:
+                p = open_serial(port_device, baudrate)
+                p.open()
+                p.close()
+                return baudrate
+            except Exception:
+                continue
+
+        return None
+
+    def print_serial_test(port_device, opened_baudrate):
+        """Print a test page, from the baud rate that opened onwards; return the baud rate that worked."""
+        for baudrate in baudrates[baudrates.index(opened_baudrate):]:
+            try:
+                p = open_serial(port_device, baudrate)
+
+                p.text(PRINT_RULE)
+                p.text("  LILY CAFE POS SYSTEM\n")
+                p.text("  Serial Test\n")
+                p.text(PRINT_RULE)
+                p.text("\n")
+                p.text(f"Port: {port_device}\n")
+                p.text(f"Baudrate: {baudrate}\n")
+                p.text("\n")
+                p.cut()
+                p.close()
+                return baudrate
+
+            except Exception:
+                continue
+
+        return None
+
     if ports:
         print(f"Found {len(ports)} serial port(s):")
         for port in ports:
             print(f"  {port.device} - {port.description}")
 
-            # Try common thermal printer port on Windows
-            if "COM" in port.device:
-                try:
-                    print(f"\n   Testing {port.device}...")
-
-                    # Try common baud rates for thermal printers
-                    for baudrate in [9600, 19200, 38400, 115200]:
-                        try:
-                            p = Serial(
-                                devfile=port.device,
-                                baudrate=baudrate,
-                                bytesize=8,
-                                parity='N',
-                                stopbits=1,
-                                timeout=1.0,
-                                profile="POS-5890"
-                            )
-
-                            p.text("=" * 32 + "\n")
-                            p.text("  LILY CAFE POS SYSTEM\n")
-                            p.text("  Serial Test\n")
-                            p.text("=" * 32 + "\n")
-                            p.text("\n")
-                            p.text(f"Port: {port.device}\n")
-                            p.text(f"Baudrate: {baudrate}\n")
-                            p.text("\n")
-                            p.cut()
-                            p.close()
-
-                            print(f"   ✅ TEST PRINT SUCCESSFUL at {baudrate} baud!")
-                            print()
-                            print("=" * 70)
-                            print("CONFIGURATION FOR .env FILE:")
-                            print("=" * 70)
-                            print(f'PRINTER_TYPE=serial')
-                            print(f'PRINTER_PORT={port.device}')
-                            print(f'PRINTER_BAUDRATE={baudrate}')
-                            print("=" * 70)
-                            detected = True
-                            break
-
-                        except Exception as e:
-                            continue
-
-                    if detected:
-                        break
+        # Try common thermal printer ports on Windows, all ports at once
+        com_ports = [port.device for port in ports if "COM" in port.device]
+        if com_ports:
+            print(f"\n   Testing {', '.join(com_ports)}...")
+            # Open all ports at once, then print only on the first that opened,
+            # in port order
+            with ThreadPoolExecutor(max_workers=len(com_ports)) as pool:
+                checks = [pool.submit(check_serial, device) for device in com_ports]
 
+            for port_device, check in zip(com_ports, checks, strict=True):
+                try:
+                    opened_baudrate = check.result()
+                    baudrate = opened_baudrate and print_serial_test(port_device, opened_baudrate)
                 except Exception as e:
                     print(f"   ❌ Failed: {e}")
                     continue
+                if not baudrate:
+                    continue
+
+                print(f"   ✅ TEST PRINT SUCCESSFUL at {baudrate} baud!")
+                print()
+                print(CONSOLE_RULE)
+                print("CONFIGURATION FOR .env FILE:")
+                print(CONSOLE_RULE)
+                print(f'PRINTER_TYPE=serial')
+                print(f'PRINTER_PORT={port_device}')
+                print(f'PRINTER_BAUDRATE={baudrate}')
+                print(CONSOLE_RULE)
+                detected = True
+                break
     else:
         print("No serial ports found")
 
@@ -248,26 +313,31 @@ except Exception as e:
     print(f"❌ Error checking serial ports: {e}")
 
 print()
-print("=" * 70)
+print(CONSOLE_RULE)
 
+# Summary written in one go rather than line by line
 if detected:
-    print("✅ PRINTER DETECTED AND TESTED SUCCESSFULLY!")
-    print()
-    print("Next steps:")
-    print("1. Copy the configuration above to your .env file")
-    print("2. Restart the backend server")
-    print("3. Use the print receipt button in the POS system")
+    sys.stdout.write(f"""\
+✅ PRINTER DETECTED AND TESTED SUCCESSFULLY!
+
+Next steps:
+1. Copy the configuration above to your .env file
+2. Restart the backend server
+3. Use the print receipt button in the POS system
+{CONSOLE_RULE}
+""")
 else:
-    print("❌ NO PRINTER DETECTED")
-    print()
-    print("Troubleshooting:")
-    print("1. Make sure printer is turned ON")
-    print("2. Check USB/Serial cable is connected")
-    print("3. Install printer drivers from Essae website")
-    print("4. On Windows: Add printer in 'Printers & Scanners'")
-    print("5. Install required libraries:")
-    print("   - Windows: uv pip install pywin32")
-    print("   - USB: uv pip install pyusb")
-    print("   - Serial: uv pip install pyserial")
-
-print("=" * 70)
+    sys.stdout.write(f"""\
+❌ NO PRINTER DETECTED
+
+Troubleshooting:
+1. Make sure printer is turned ON
+2. Check USB/Serial cable is connected
+3. Install printer drivers from Essae website
+4. On Windows: Add printer in 'Printers & Scanners'
+5. Install required libraries:
+   - Windows: uv pip install pywin32
+   - USB: uv pip install pyusb
+   - Serial: uv pip install pyserial
+{CONSOLE_RULE}
+""")
@@ -0,0 +1,31 @@
+"""
+Shared helpers for the single-column migration scripts.
+"""
+
+import sqlite3
+
+from app.core.config import settings
+
+
+def connect():
+    """
+    Open the app database with plain sqlite3.
+    Same file SQLAlchemy would open; relative paths resolve from the working
+    directory in both cases.
+    """
+    return sqlite3.connect(settings.DATABASE_URL.removeprefix("sqlite:///"))
+
+
+def add_column_if_missing(conn, table: str, column: str, ddl: str) -> bool:
+    """Add `column` to `table` with ALTER TABLE unless it already exists. Returns True if added."""
+    # Check if column already exists
+    if any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})")):
+        print(f"✓ Column '{column}' already exists. Skipping migration.")
+        return False
+
+    print(f"Adding '{column}' column to {table} table...")
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    conn.commit()
+
+    print("✓ Migration completed successfully!")
+    return True
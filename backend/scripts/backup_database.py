@@ -11,6 +11,9 @@ USAGE:
     # Backup + upload to cloud (configure cloud settings below)
     uv run python scripts/backup_database.py --upload
 
+    # Raw file copy, faster but only safe while nobody is taking orders
+    uv run python scripts/backup_database.py --fast
+
 SETUP CLOUD SYNC (Choose one):
     1. Google Drive: Use rclone (recommended - free unlimited storage)
     2. Dropbox: Use rclone
@@ -27,6 +30,7 @@ AUTOMATION:
     0 */6 * * * cd /path/to/lily-cafe-pos/backend && /path/to/uv run python scripts/backup_database.py --upload
 """
 
+import os
 import sys
 import shutil
 import subprocess
@@ -49,6 +53,10 @@ BACKUP_DIR = Path(__file__).parent.parent / "backups"
 DATABASE_FILE = Path(__file__).parent.parent / "restaurant.db"
 MAX_LOCAL_BACKUPS = 30  # Keep last 30 backups locally (e.g., 30 days if daily backup)
 
+# Compress backups with zstd when it is installed (https://github.com/facebook/zstd)
+COMPRESS_BACKUPS = True
+ZSTD_LEVEL = 3
+
 # Cloud upload settings (configure based on your chosen service)
 CLOUD_ENABLED = False  # Set to True after configuring cloud settings
 
@@ -57,10 +65,22 @@ CLOUD_ENABLED = False  # Set to True after configuring cloud settings
 # Setup: rclone config
 RCLONE_REMOTE = "gdrive"  # Name you gave during rclone config
 RCLONE_PATH = "lily-cafe-backups"  # Folder in cloud storage
+# Upload tuning: more parallel transfers, split large files into parallel streams,
+# and bigger Drive chunks (fewer API round-trips)
+RCLONE_FLAGS = [
+    "--transfers=16",
+    "--checkers=32",
+    "--multi-thread-streams=4",
+    "--multi-thread-cutoff=50M",
+    "--drive-chunk-size=64M",
+]
 
 # For AWS S3 (if you prefer S3)
 AWS_S3_BUCKET = "lily-cafe-backups"
 AWS_S3_PREFIX = "database/"
+# Multipart upload tuning: 16 MB parts, up to 20 uploaded in parallel
+AWS_S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+AWS_S3_MAX_CONCURRENCY = 20
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -68,12 +88,41 @@ AWS_S3_PREFIX = "database/"
 # ════════════════════════════════════════════════════════════════════════════
 
 def create_backup_filename():
-    """Generate timestamped backup filename."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    """
+    Generate timestamped backup filename.
+    Microseconds keep two backups in the same second from overwriting each
+    other without checking whether the name is already taken.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     return f"restaurant_backup_{timestamp}.db"
 
 
-def create_local_backup():
+def copy_database_file(backup_path):
+    """
+    Raw-copy the database file, skipping SQLite's page-by-page backup walk.
+    Only safe while nothing is writing (e.g. the nightly cron run).
+
+    Returns False without copying if the WAL could not be folded back into the
+    main file (an open reader pins it), since the raw file alone would be corrupt.
+    """
+    import sqlite3
+    source = sqlite3.connect(str(DATABASE_FILE))
+    try:
+        # Fold the WAL back into the main file so the copy is complete
+        busy, log, checkpointed = source.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    finally:
+        source.close()
+
+    # log is -1 when the database is not in WAL mode
+    if busy != 0 or (log >= 0 and checkpointed != log):
+        return False
+
+    # copyfile hands the copy to the kernel (sendfile on Linux, fcopyfile on macOS)
+    shutil.copyfile(DATABASE_FILE, backup_path)
+    return True
+
+
+def create_local_backup(fast=False):
     """Create a local backup of the database."""
     # Ensure backup directory exists
     BACKUP_DIR.mkdir(exist_ok=True)
@@ -83,49 +132,125 @@ def create_local_backup():
         print(f"❌ Database file not found: {DATABASE_FILE}")
         return None
 
-    # Create backup
+    # Create backup. It is written under a .tmp name and renamed into place once
+    # complete, so an interrupted run never leaves a torn file that looks like a backup
     backup_filename = create_backup_filename()
     backup_path = BACKUP_DIR / backup_filename
+    tmp_path = BACKUP_DIR / f"{backup_filename}.tmp"
 
     try:
+        if fast:
+            if copy_database_file(tmp_path):
+                os.replace(tmp_path, backup_path)
+                file_size = backup_path.stat().st_size / (1024 * 1024)  # MB
+                print(f"✅ Local backup created: {backup_filename} ({file_size:.2f} MB, raw copy)")
+                return backup_path
+            print("ℹ️  Database is in use, falling back to SQLite's backup API")
+
         # Use SQLite's built-in backup command for safe backup
         # This ensures backup even if database is in use
         import sqlite3
         source = sqlite3.connect(str(DATABASE_FILE))
-        backup = sqlite3.connect(str(backup_path))
-        source.backup(backup)
-        backup.close()
-        source.close()
-
-        file_size = backup_path.stat().st_size / (1024 * 1024)  # MB
+        backup = sqlite3.connect(str(tmp_path))
+        try:
+            # WAL (persistent) lets the POS keep writing orders while the backup reads;
+            # NORMAL drops the per-commit fsync
+            source.execute("PRAGMA journal_mode=WAL")
+            source.execute("PRAGMA synchronous=NORMAL")
+            # A half-written backup is discarded anyway, so skip journaling and fsyncs on it
+            backup.execute("PRAGMA journal_mode=OFF")
+            backup.execute("PRAGMA synchronous=OFF")
+
+            # The backup is page_count * page_size bytes, so its size comes from
+            # the progress callback rather than a stat() of the new file
+            page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            page_count = 0
+
+            def record_page_count(status, remaining, total):
+                nonlocal page_count
+                page_count = total
+
+            # Copy every page in a single step: no step boundaries, no sleeps between them
+            source.backup(backup, pages=-1, progress=record_page_count)
+        finally:
+            backup.close()
+            source.close()
+        os.replace(tmp_path, backup_path)
+
+        file_size = page_count * page_size / (1024 * 1024)  # MB
         print(f"✅ Local backup created: {backup_filename} ({file_size:.2f} MB)")
         return backup_path
 
     except Exception as e:
         print(f"❌ Failed to create backup: {e}")
+        tmp_path.unlink(missing_ok=True)
         return None
 
 
-def cleanup_old_backups():
-    """Remove old backups, keeping only MAX_LOCAL_BACKUPS most recent."""
+def compress_backup(backup_path):
+    """Compress a backup with zstd, returning the .db.zst path (or the original if zstd is unavailable)."""
+    if not COMPRESS_BACKUPS:
+        return backup_path
+
+    compressed_path = backup_path.with_name(backup_path.name + ".zst")
+    try:
+        # -T0: one worker thread per core; --rm drops the uncompressed copy on success
+        subprocess.run(
+            ["zstd", "-q", "-T0", f"-{ZSTD_LEVEL}", "--rm", str(backup_path), "-o", str(compressed_path)],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except FileNotFoundError:
+        print("ℹ️  zstd not found, keeping uncompressed backup")
+        return backup_path
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Compression failed, keeping uncompressed backup: {e.stderr}")
+        compressed_path.unlink(missing_ok=True)
+        return backup_path
+
+    file_size = compressed_path.stat().st_size / (1024 * 1024)  # MB
+    print(f"🗜️  Compressed backup: {compressed_path.name} ({file_size:.2f} MB)")
+    return compressed_path
+
+
+def cleanup_old_backups(current_backup=None):
+    """
+    Remove old backups, keeping only MAX_LOCAL_BACKUPS most recent.
+    Also removes .tmp files left by runs older than current_backup that were
+    killed mid-backup; a newer run may still be writing its own.
+    """
     if not BACKUP_DIR.exists():
         return
 
-    # Get all backup files sorted by modification time (newest first)
+    names = [name for name in os.listdir(BACKUP_DIR) if name.startswith("restaurant_backup_")]
+
+    # The YYYYMMDD_HHMMSS[_ffffff] timestamp in the name sorts chronologically,
+    # so comparing names tells which run is older; no stat() is needed
+    if current_backup is not None:
+        cutoff = current_backup.name.removesuffix(".zst")
+        for name in names:
+            if name.endswith(".tmp") and name < cutoff:
+                try:
+                    os.unlink(BACKUP_DIR / name)
+                    print(f"🗑️  Removed unfinished backup {name}")
+                except Exception as e:
+                    print(f"⚠️  Failed to remove unfinished backup {name}: {e}")
+
+    # Get all backup files, newest first
     backups = sorted(
-        BACKUP_DIR.glob("restaurant_backup_*.db"),
-        key=lambda p: p.stat().st_mtime,
+        (name for name in names if name.endswith((".db", ".db.zst"))),
         reverse=True
     )
 
     # Remove old backups
     removed_count = 0
-    for backup in backups[MAX_LOCAL_BACKUPS:]:
+    for name in backups[MAX_LOCAL_BACKUPS:]:
         try:
-            backup.unlink()
+            os.unlink(BACKUP_DIR / name)
             removed_count += 1
         except Exception as e:
-            print(f"⚠️  Failed to remove old backup {backup.name}: {e}")
+            print(f"⚠️  Failed to remove old backup {name}: {e}")
 
     if removed_count > 0:
         print(f"🗑️  Removed {removed_count} old backup(s), kept {MAX_LOCAL_BACKUPS} most recent")
@@ -137,25 +262,61 @@ def upload_to_rclone(backup_path):
         print("ℹ️  Cloud upload disabled (set CLOUD_ENABLED=True to enable)")
         return False
 
-    # Check if rclone is installed
-    try:
-        subprocess.run(["rclone", "version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if rclone is installed (a PATH lookup, no need to run it)
+    rclone = shutil.which("rclone")
+    if not rclone:
         print("❌ rclone not found. Install from: https://rclone.org/install/")
         return False
 
+    # An uncompressed local backup (COMPRESS_BACKUPS off) is still uploaded
+    # compressed: zstd streams into rclone rcat, so the .zst never touches the disk
+    zstd = shutil.which("zstd") if backup_path.suffix == ".db" else None
+
     # Upload to cloud
-    remote_path = f"{RCLONE_REMOTE}:{RCLONE_PATH}/{backup_path.name}"
+    remote_name = f"{backup_path.name}.zst" if zstd else backup_path.name
+    remote_path = f"{RCLONE_REMOTE}:{RCLONE_PATH}/{remote_name}"
 
     print(f"☁️  Uploading to {remote_path}...")
 
     try:
-        result = subprocess.run(
-            ["rclone", "copy", str(backup_path), f"{RCLONE_REMOTE}:{RCLONE_PATH}"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if zstd:
+            # rcat can't tell a finished stream from one cut short by zstd dying, so
+            # stream to a .partial name and move it into place only once both succeed
+            partial_path = f"{remote_path}.partial"
+            uploaded = False
+            try:
+                with subprocess.Popen(
+                    [zstd, "-q", "-T0", f"-{ZSTD_LEVEL}", "--stdout", str(backup_path)],
+                    stdout=subprocess.PIPE
+                ) as compressor:
+                    subprocess.run(
+                        [rclone, "rcat", partial_path, *RCLONE_FLAGS],
+                        stdin=compressor.stdout,
+                        capture_output=True,
+                        text=True,
+                        check=True
+                    )
+                if compressor.returncode != 0:
+                    print(f"❌ Cloud upload failed: zstd exited with status {compressor.returncode}")
+                    return False
+                subprocess.run(
+                    [rclone, "moveto", partial_path, remote_path],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                uploaded = True
+            finally:
+                if not uploaded:
+                    # Don't leave a truncated upload behind
+                    subprocess.run([rclone, "deletefile", partial_path], capture_output=True)
+        else:
+            subprocess.run(
+                [rclone, "copy", str(backup_path), f"{RCLONE_REMOTE}:{RCLONE_PATH}", *RCLONE_FLAGS],
+                capture_output=True,
+                text=True,
+                check=True
+            )
         print(f"✅ Uploaded to cloud: {remote_path}")
         return True
     except subprocess.CalledProcessError as e:
@@ -170,12 +331,19 @@ def upload_to_s3(backup_path):
 
     try:
         import boto3
+        from boto3.s3.transfer import TransferConfig
         s3 = boto3.client('s3')
+        config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=AWS_S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=AWS_S3_MAX_CONCURRENCY,
+            use_threads=True,
+        )
 
         key = f"{AWS_S3_PREFIX}{backup_path.name}"
         print(f"☁️  Uploading to S3: s3://{AWS_S3_BUCKET}/{key}")
 
-        s3.upload_file(str(backup_path), AWS_S3_BUCKET, key)
+        s3.upload_file(str(backup_path), AWS_S3_BUCKET, key, Config=config)
         print(f"✅ Uploaded to S3: s3://{AWS_S3_BUCKET}/{key}")
         return True
     except ImportError:
@@ -194,6 +362,7 @@ def main():
     parser = argparse.ArgumentParser(description="Backup Lily Cafe POS database")
     parser.add_argument("--upload", action="store_true", help="Upload backup to cloud storage")
     parser.add_argument("--cloud", choices=["rclone", "s3"], default="rclone", help="Cloud provider")
+    parser.add_argument("--fast", action="store_true", help="Raw file copy instead of SQLite's backup API (only while the POS is idle)")
     args = parser.parse_args()
 
     print("=" * 80)
@@ -204,12 +373,13 @@ def main():
     print()
 
     # Create local backup
-    backup_path = create_local_backup()
+    backup_path = create_local_backup(fast=args.fast)
     if not backup_path:
         sys.exit(1)
+    backup_path = compress_backup(backup_path)
 
     # Cleanup old backups
-    cleanup_old_backups()
+    cleanup_old_backups(backup_path)
 
     # Upload to cloud if requested
     if args.upload:
@@ -229,7 +399,10 @@ def main():
 
     print()
     print("To restore from backup:")
-    print(f"  cp {backup_path} {DATABASE_FILE}")
+    if backup_path.suffix == ".zst":
+        print(f"  zstd -d -f {backup_path} -o {DATABASE_FILE}")
+    else:
+        print(f"  cp {backup_path} {DATABASE_FILE}")
     print()
     print("=" * 80)
 
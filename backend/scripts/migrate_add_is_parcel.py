@@ -9,9 +9,8 @@ from pathlib import Path
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
-from app.db.session import engine
 from app.core.config import settings
+from scripts._migration_lib import add_column_if_missing, connect
 
 
 def migrate():
@@ -19,23 +18,12 @@ def migrate():
     print("Running migration: Add is_parcel to orders")
     print(f"Database: {settings.DATABASE_URL}")
 
-    with engine.connect() as conn:
-        # Check if column already exists
-        result = conn.execute(text("PRAGMA table_info(orders)"))
-        columns = [row[1] for row in result]
-
-        if 'is_parcel' in columns:
-            print("✓ Column 'is_parcel' already exists. Skipping migration.")
-            return
-
+    conn = connect()
+    try:
         # Add the column with default value False
-        print("Adding 'is_parcel' column to orders table...")
-        conn.execute(text(
-            "ALTER TABLE orders ADD COLUMN is_parcel BOOLEAN DEFAULT 0 NOT NULL"
-        ))
-        conn.commit()
-
-        print("✓ Migration completed successfully!")
+        add_column_if_missing(conn, "orders", "is_parcel", "BOOLEAN DEFAULT 0 NOT NULL")
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
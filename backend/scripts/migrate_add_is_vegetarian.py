@@ -54,9 +54,9 @@ def migrate():
     try:
         # Check if column already exists
         cursor.execute("PRAGMA table_info(menu_items)")
-        columns = [row[1] for row in cursor.fetchall()]
+        column_exists = any(row[1] == "is_vegetarian" for row in cursor)
 
-        if "is_vegetarian" in columns:
+        if column_exists:
             print("[OK] Column 'is_vegetarian' already exists in menu_items table.")
             print("   No migration needed.")
         else:
@@ -293,12 +293,12 @@ This keeps related tables grouped together and makes the file easy to navigate.
 
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text, inspect
+from sqlalchemy import text
 from app.db.session import engine
 from app.core.config import settings
 
@@ -600,19 +600,15 @@ SCHEMA_DEFINITIONS = {
 # HELPER FUNCTIONS
 # ════════════════════════════════════════════════════════════════════════════
 
-def check_table_exists(conn, table_name: str) -> bool:
-    """Check if a table exists in the database."""
+def get_existing_schema(conn) -> Tuple[Set[str], Set[str]]:
+    """Get the names of all tables and all indexes in one sqlite_master scan."""
     result = conn.execute(text(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"
-    ), {"table_name": table_name})
-    return result.fetchone() is not None
-
-
-def check_column_exists(conn, table_name: str, column_name: str) -> bool:
-    """Check if a column exists in a table."""
-    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
-    columns = [row[1] for row in result]
-    return column_name in columns
+        "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'index')"
+    ))
+    tables, indexes = set(), set()
+    for name, object_type in result:
+        (tables if object_type == "table" else indexes).add(name)
+    return tables, indexes
 
 
 def get_existing_columns(conn, table_name: str) -> List[str]:
@@ -621,14 +617,6 @@ def get_existing_columns(conn, table_name: str) -> List[str]:
     return [row[1] for row in result]
 
 
-def check_index_exists(conn, index_name: str) -> bool:
-    """Check if an index exists in the database."""
-    result = conn.execute(text(
-        "SELECT name FROM sqlite_master WHERE type='index' AND name=:index_name"
-    ), {"index_name": index_name})
-    return result.fetchone() is not None
-
-
 def create_table(conn, table_name: str, definition: Dict) -> bool:
     """Create a table with all its columns, indexes, and foreign keys."""
     columns_sql = []
@@ -653,7 +641,6 @@ def create_table(conn, table_name: str, definition: Dict) -> bool:
 
     try:
         conn.execute(text(create_sql))
-        conn.commit()
         print(f"    ✓ Created table '{table_name}'")
         return True
     except Exception as e:
@@ -669,7 +656,6 @@ def add_column(conn, table_name: str, col_name: str, col_type: str, col_constrai
 
     try:
         conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_def}"))
-        conn.commit()
         print(f"    ✓ Added column '{table_name}.{col_name}'")
         return True
     except Exception as e:
@@ -682,7 +668,6 @@ def create_index(conn, index_name: str, table_name: str, columns: List[str]) ->
     columns_str = ", ".join(columns)
     try:
         conn.execute(text(f"CREATE INDEX {index_name} ON {table_name}({columns_str})"))
-        conn.commit()
         print(f"    ✓ Created index '{index_name}'")
         return True
     except Exception as e:
@@ -703,7 +688,9 @@ def migrate():
     - Columns
     - Indexes
 
-    This is the main function that does all the work.
+    This is the main function that does all the work. Every change is made
+    in one transaction and committed once at the end; if any change fails,
+    all of them are rolled back.
     """
     print("=" * 80)
     print("  Lily Cafe POS - Comprehensive Database Migration")
@@ -712,11 +699,21 @@ def migrate():
     print()
 
     changes_applied = 0
+    failed_changes = 0
 
     with engine.connect() as conn:
-        # Get list of existing tables for quick reference
-        inspector = inspect(engine)
-        existing_tables = inspector.get_table_names()
+        # pysqlite never opens a transaction for DDL, so each CREATE/ALTER would
+        # commit on its own; start one explicitly so all changes commit together
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        # Read the existing schema once up front; everything below is set lookups.
+        # Columns are kept current as changes are applied
+        existing_tables, existing_indexes = get_existing_schema(conn)
+        columns_by_table: Dict[str, Set[str]] = {
+            table_name: set(get_existing_columns(conn, table_name))
+            for table_name in SCHEMA_DEFINITIONS
+            if table_name in existing_tables
+        }
 
         print("📊 SCHEMA VALIDATION & MIGRATION")
         print("-" * 80)
@@ -729,23 +726,28 @@ def migrate():
             # ────────────────────────────────────────────────────────────────
             # 1. CHECK TABLE EXISTS
             # ────────────────────────────────────────────────────────────────
-            if not check_table_exists(conn, table_name):
+            if table_name not in existing_tables:
                 print(f"  ⚠️  Table '{table_name}' does not exist - creating...")
                 if create_table(conn, table_name, table_def):
                     changes_applied += 1
+                    columns_by_table[table_name] = {col[0] for col in table_def["columns"]}
 
                     # Create indexes for new table
                     if "indexes" in table_def:
                         for index_name, index_columns in table_def["indexes"]:
                             if create_index(conn, index_name, table_name, index_columns):
                                 changes_applied += 1
+                            else:
+                                failed_changes += 1
+                else:
+                    failed_changes += 1
                 print()
                 continue
 
             # ────────────────────────────────────────────────────────────────
             # 2. CHECK COLUMNS
             # ────────────────────────────────────────────────────────────────
-            existing_columns = get_existing_columns(conn, table_name)
+            existing_columns = columns_by_table[table_name]
             missing_columns = []
 
             for col_name, col_type, col_constraints in table_def["columns"]:
@@ -757,6 +759,9 @@ def migrate():
                 for col_name, col_type, col_constraints in missing_columns:
                     if add_column(conn, table_name, col_name, col_type, col_constraints):
                         changes_applied += 1
+                        existing_columns.add(col_name)
+                    else:
+                        failed_changes += 1
             else:
                 print(f"  ✓ All columns present")
 
@@ -766,7 +771,7 @@ def migrate():
             if "indexes" in table_def:
                 missing_indexes = []
                 for index_name, index_columns in table_def["indexes"]:
-                    if not check_index_exists(conn, index_name):
+                    if index_name not in existing_indexes:
                         missing_indexes.append((index_name, index_columns))
 
                 if missing_indexes:
@@ -774,11 +779,21 @@ def migrate():
                     for index_name, index_columns in missing_indexes:
                         if create_index(conn, index_name, table_name, index_columns):
                             changes_applied += 1
+                        else:
+                            failed_changes += 1
                 else:
                     print(f"  ✓ All indexes present")
 
             print()
 
+        # All or nothing: a failed change rolls back the ones that succeeded
+        if failed_changes:
+            conn.rollback()
+            raise RuntimeError(
+                f"{failed_changes} schema change(s) failed - rolled back all {changes_applied} applied change(s)"
+            )
+        conn.commit()
+
         # ════════════════════════════════════════════════════════════════════
         # SUMMARY
         # ════════════════════════════════════════════════════════════════════
@@ -796,9 +811,8 @@ def migrate():
         print("-" * 80)
 
         for table_name in sorted(SCHEMA_DEFINITIONS.keys()):
-            if check_table_exists(conn, table_name):
-                columns = get_existing_columns(conn, table_name)
-                print(f"  ✓ {table_name} ({len(columns)} columns)")
+            if table_name in columns_by_table:
+                print(f"  ✓ {table_name} ({len(columns_by_table[table_name])} columns)")
 
         print()
         print("=" * 80)
@@ -0,0 +1,79 @@
+"""
+Unit tests for the database backup script.
+Runs against scratch SQLite files, so the real restaurant.db is never touched.
+"""
+
+import sqlite3
+
+import pytest
+
+from scripts import backup_database
+
+
+@pytest.fixture
+def scratch_db(tmp_path, monkeypatch):
+    """A WAL-mode database with some rows, plus an empty backups directory."""
+    db_file = tmp_path / "restaurant.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, total INTEGER)")
+    conn.executemany("INSERT INTO orders (total) VALUES (?)", [(i,) for i in range(100)])
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(backup_database, "DATABASE_FILE", db_file)
+    monkeypatch.setattr(backup_database, "BACKUP_DIR", tmp_path / "backups")
+    return db_file
+
+
+def test_fast_backup_copies_idle_database(scratch_db, capsys):
+    backup_path = backup_database.create_local_backup(fast=True)
+
+    assert "raw copy" in capsys.readouterr().out
+    conn = sqlite3.connect(backup_path)
+    assert conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 100
+    conn.close()
+
+
+def test_fast_backup_falls_back_while_reader_pins_wal(scratch_db, capsys):
+    # The POS holds a read transaction while another connection commits, so the
+    # checkpoint can't fold the new frames back into the main file
+    reader = sqlite3.connect(scratch_db, isolation_level=None)
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM orders").fetchone()
+    writer = sqlite3.connect(scratch_db)
+    writer.execute("PRAGMA wal_autocheckpoint=0")
+    writer.executemany("INSERT INTO orders (total) VALUES (?)", [(i,) for i in range(50)])
+    writer.commit()
+
+    try:
+        backup_path = backup_database.create_local_backup(fast=True)
+    finally:
+        writer.close()
+        reader.close()
+
+    out = capsys.readouterr().out
+    assert "raw copy" not in out
+    assert "falling back" in out
+    conn = sqlite3.connect(backup_path)
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 150
+    conn.close()
+    assert list(backup_database.BACKUP_DIR.glob("*.tmp")) == []
+
+
+def test_rotation_removes_tmp_files_from_older_runs(scratch_db):
+    backup_dir = backup_database.BACKUP_DIR
+    backup_dir.mkdir()
+    stale = backup_dir / "restaurant_backup_20260101_020000_000000.db.tmp"
+    newer = backup_dir / "restaurant_backup_20990101_020000_000000.db.tmp"
+    stale.write_bytes(b"torn")
+    newer.write_bytes(b"in progress")
+
+    backup_path = backup_database.create_local_backup()
+    backup_database.cleanup_old_backups(backup_path)
+
+    assert not stale.exists()
+    # A run that started after this one may still be writing
+    assert newer.exists()
+    assert backup_path.exists()
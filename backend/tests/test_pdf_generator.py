@@ -0,0 +1,79 @@
+"""
+Unit tests for receipt PDF helpers.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.utils.pdf_generator import (
+    CHIT_TIME_FORMAT,
+    RECEIPT_DATETIME_FORMAT,
+    convert_to_local_timezone,
+    format_currency,
+    format_local_datetime,
+    generate_receipts_bulk,
+)
+
+
+class TestFormatCurrency:
+    """Test rupee formatting of paise amounts."""
+
+    def test_formats_rupees_and_paise(self):
+        assert format_currency(12345) == "₹123.45"
+        assert format_currency(100) == "₹1.00"
+        assert format_currency(5) == "₹0.05"
+        assert format_currency(0) == "₹0.00"
+
+    def test_large_amount_has_no_float_rounding(self):
+        assert format_currency(123456789012345) == "₹1234567890123.45"
+
+    def test_negative_amount(self):
+        assert format_currency(-150) == "₹-1.50"
+
+
+class TestGenerateReceiptsBulk:
+    """Test bulk receipt generation."""
+
+    @staticmethod
+    def _order(order_number: str):
+        item = SimpleNamespace(
+            quantity=2, menu_item_name="Masala Dosa", unit_price=12000, subtotal=24000
+        )
+        return SimpleNamespace(
+            order_number=order_number,
+            table_number=3,
+            customer_name=None,
+            created_at=datetime(2026, 1, 1, 8, 30),
+            order_items=[item],
+            subtotal=24000,
+            gst_amount=4320,
+            total_amount=28300,
+        )
+
+    def test_returns_one_pdf_per_order_in_input_order(self):
+        orders = [self._order("ORD-1"), self._order("ORD-2"), self._order("ORD-3")]
+
+        pdfs = generate_receipts_bulk(orders, paper_size="58mm", max_workers=2)
+
+        assert len(pdfs) == 3
+        assert all(pdf.startswith(b"%PDF") for pdf in pdfs)
+
+    def test_empty_input(self):
+        assert generate_receipts_bulk([]) == []
+
+
+class TestFormatLocalDatetime:
+    """Test UTC to local time formatting."""
+
+    def test_naive_datetime_is_treated_as_utc(self):
+        # Default TIMEZONE is Asia/Kolkata (UTC+5:30)
+        assert format_local_datetime(datetime(2026, 1, 1, 8, 30), "%d-%m-%Y %I:%M %p") == (
+            "01-01-2026 02:00 PM"
+        )
+
+    def test_receipt_and_chit_formats_match_strftime(self):
+        for hour in (0, 6, 11, 12, 13, 18, 23):
+            utc = datetime(2026, 3, 9, hour, 5)
+            local = convert_to_local_timezone(utc)
+            for fmt in (RECEIPT_DATETIME_FORMAT, CHIT_TIME_FORMAT):
+                assert format_local_datetime(utc, fmt) == local.strftime(fmt)
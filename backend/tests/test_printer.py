@@ -0,0 +1,543 @@
+"""
+Unit tests for the ESC/POS thermal printer helpers.
+Uses a fake printer device, so no hardware is required.
+"""
+
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.utils import printer
+from app.utils.printer import EscposBuffer
+
+
+class FakePrinter:
+    """Records raw writes instead of talking to a device."""
+
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def _raw(self, msg: bytes):
+        self.writes.append(msg)
+
+    def text(self, txt: str):
+        self.writes.append(txt.encode("cp437"))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_printer(monkeypatch):
+    """Enable printing and route it to a FakePrinter."""
+    device = FakePrinter()
+    monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+    monkeypatch.setattr(printer, "get_printer", lambda: device)
+    printer.reset_printer()
+    yield device
+    printer.reset_printer()
+
+
+@pytest.fixture
+def chits_dir(tmp_path, monkeypatch):
+    """Save chit record PDFs under tmp_path instead of ./chits."""
+    monkeypatch.setattr(printer, "CHITS_DIR", str(tmp_path))
+    yield tmp_path
+    # Let queued PDF writes finish before CHITS_DIR is restored
+    printer._chit_pdf_executor.submit(lambda: None).result()
+
+
+@pytest.fixture
+def order():
+    item = SimpleNamespace(
+        quantity=2,
+        menu_item_name="Masala Dosa",
+        unit_price=12000,
+        subtotal=24000,
+        is_beverage=False,
+        is_parcel=False,
+    )
+    return SimpleNamespace(
+        order_number="ORD-20260101-0001",
+        table_number=7,
+        customer_name=None,
+        created_at=datetime(2026, 1, 1, 8, 30),
+        order_items=[item],
+        subtotal=24000,
+        gst_amount=4320,
+        total_amount=28300,
+    )
+
+
+class TestFormatCurrency:
+    """Test receipt currency formatting."""
+
+    def test_formats_paise_as_rupees(self):
+        assert printer.format_currency(0) == "Rs.0.00"
+        assert printer.format_currency(150) == "Rs.1.50"
+        assert printer.format_currency(123456789) == "Rs.1234567.89"
+
+    def test_negative_amount(self):
+        assert printer.format_currency(-5) == "Rs.-0.05"
+
+
+class TestEscposBuffer:
+    """Test ESC/POS byte generation."""
+
+    def test_starts_with_printer_init(self):
+        assert EscposBuffer().getvalue() == b"\x1b@"
+
+    def test_set_emits_style_commands(self):
+        buf = EscposBuffer()
+        buf.set(align="center", bold=True, width=2, height=2)
+        buf.text("TABLE 7\n")
+
+        assert buf.getvalue() == b"\x1b@" + b"\x1d!\x11" + b"\x1bE\x01" + b"\x1ba\x01" + b"TABLE 7\n"
+
+    def test_repeated_identical_set_is_skipped(self):
+        buf = EscposBuffer()
+        buf.set(align="center", bold=True)
+        once = buf.getvalue()
+        buf.set(align="center", bold=True)
+
+        assert buf.getvalue() == once
+
+    def test_set_sends_only_changed_attributes(self):
+        buf = EscposBuffer()
+        buf.set(align="center", bold=True, width=2, height=2)
+        before = buf.getvalue()
+        buf.set(align="center", bold=False, width=2, height=2)
+
+        assert buf.getvalue() == before + b"\x1bE\x00"
+
+    def test_raw_appends_bytes_unchanged(self):
+        buf = EscposBuffer()
+        buf.raw(printer.SEP_DASH_58)
+
+        assert buf.getvalue() == b"\x1b@" + b"-" * 32 + b"\n"
+
+    def test_defaults_after_init_are_not_resent(self):
+        buf = EscposBuffer()
+        buf.set(align="left", bold=False, underline=False, width=1, height=1)
+
+        assert buf.getvalue() == b"\x1b@"
+
+    def test_non_ascii_text_uses_printer_code_page(self):
+        buf = EscposBuffer()
+        buf.text("Name: Zoë ₹\n")
+
+        assert buf.getvalue() == b"\x1b@" + b"Name: Zo\x89 ?\n"
+
+
+class TestPrintReceipt:
+    """Test receipt printing through a fake device."""
+
+    def test_receipt_is_sent_in_one_write(self, fake_printer, order):
+        assert printer.print_receipt(order) is True
+
+        assert len(fake_printer.writes) == 1
+        assert b"Table 7" in fake_printer.writes[0]
+        assert b"Rs.240.00" in fake_printer.writes[0]
+        assert fake_printer.writes[0].endswith(printer.FEED_AND_FULL_CUT)
+
+    def test_printer_without_cutter_gets_feed_in_same_write(self, fake_printer, order):
+        fake_printer.profile = SimpleNamespace(supports=lambda feature: False)
+
+        assert printer.print_receipt(order) is True
+
+        assert len(fake_printer.writes) == 1
+        assert fake_printer.writes[0].endswith(printer.PAPER_FEED)
+
+    def test_partial_cutter_gets_partial_cut(self, fake_printer, order):
+        fake_printer.profile = SimpleNamespace(supports=lambda feature: feature == "paperPartCut")
+
+        assert printer.print_receipt(order) is True
+
+        assert len(fake_printer.writes) == 1
+        assert fake_printer.writes[0].endswith(printer.FEED_AND_PART_CUT)
+
+    def test_header_follows_settings_changes(self, fake_printer, order, monkeypatch):
+        monkeypatch.setattr(settings, "RESTAURANT_GSTIN", "29ABCDE1234F1Z5")
+        assert printer.print_receipt(order) is True
+        monkeypatch.setattr(settings, "RESTAURANT_GSTIN", "29ZZZZZ9999Z9Z9")
+        assert printer.print_receipt(order) is True
+
+        assert b"GSTIN: 29ABCDE1234F1Z5" in fake_printer.writes[0]
+        assert b"GSTIN: 29ZZZZZ9999Z9Z9" in fake_printer.writes[1]
+
+
+class TestPrintOrderChit:
+    """Test kitchen chit printing through a fake device."""
+
+    def test_chit_is_sent_in_one_write(self, fake_printer, order, chits_dir):
+        assert printer.print_order_chit(order) is True
+
+        assert len(fake_printer.writes) == 1
+        assert b"TABLE 7" in fake_printer.writes[0]
+        assert b"2x Masala Dosa" in fake_printer.writes[0]
+        assert b"KITCHEN" in fake_printer.writes[0]
+
+    def test_table_banner_uses_native_double_size(self, fake_printer, order, chits_dir):
+        assert printer.print_order_chit(order) is True
+
+        # One GS ! size command ahead of the banner, no multi-line ASCII art
+        assert fake_printer.writes[0].startswith(b"\x1b@\x1d!\x11\x1bE\x01\x1ba\x01TABLE 7\n")
+
+    def test_chit_pdf_saved_in_background(self, fake_printer, order, chits_dir):
+        assert printer.print_order_chit(order) is True
+        # Wait for the queued PDF write to finish
+        printer._chit_pdf_executor.submit(lambda: None).result()
+
+        pdf_path = chits_dir / f"Table_7_{order.order_number}_KITCHEN.pdf"
+        assert pdf_path.read_bytes().startswith(b"%PDF")
+
+    def test_chits_directory_created_on_first_chit(self, fake_printer, order, chits_dir, monkeypatch):
+        monkeypatch.setattr(printer, "CHITS_DIR", str(chits_dir / "chits"))
+
+        assert printer.print_order_chit(order) is True
+        printer._chit_pdf_executor.submit(lambda: None).result()
+
+        assert len(list((chits_dir / "chits").glob("*.pdf"))) == 1
+
+    def test_windows_raw_printer_skips_pdf_print_handler(self, fake_printer, order, chits_dir, monkeypatch):
+        from app.utils import chit_generator
+
+        monkeypatch.setattr(settings, "PRINTER_TYPE", "win32")
+        monkeypatch.setattr(chit_generator, "_SYSTEM", "Windows")
+        order.order_items.append(SimpleNamespace(
+            quantity=1, menu_item_name="Filter Coffee", is_beverage=True, is_parcel=False
+        ))
+
+        assert chit_generator.save_and_print_chit(order) is True
+        printer._chit_pdf_executor.submit(lambda: None).result()
+
+        # One combined chit, as with the PDF path: no station split, footer or record PDF
+        assert len(fake_printer.writes) == 1
+        assert b"2x Masala Dosa" in fake_printer.writes[0]
+        assert b"1x Filter Coffee" in fake_printer.writes[0]
+        assert b"KITCHEN" not in fake_printer.writes[0]
+        assert list(chits_dir.iterdir()) == []
+
+
+class TestFindPrintTool:
+    """Test cached discovery of external PDF print tools."""
+
+    def test_lookup_is_cached_until_refresh(self, tmp_path):
+        tool = tmp_path / "SumatraPDF.exe"
+        candidates = (str(tool),)
+        printer.refresh_print_backend()
+
+        assert printer._find_print_tool(candidates) is None
+        tool.write_bytes(b"")
+        assert printer._find_print_tool(candidates) is None
+
+        printer.refresh_print_backend()
+        assert printer._find_print_tool(candidates) == str(tool)
+
+
+class TestUsbPrinter:
+    """Test USB printer configuration."""
+
+    def test_hex_ids_are_parsed(self, monkeypatch):
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(settings, "PRINTER_TYPE", "usb")
+        monkeypatch.setattr(settings, "PRINTER_VENDOR_ID", "0x0dd4")
+        monkeypatch.setattr(settings, "PRINTER_PRODUCT_ID", "1234")
+        monkeypatch.setattr(printer, "Usb", lambda vendor_id, product_id: (vendor_id, product_id))
+
+        assert printer.get_printer() == (0x0DD4, 0x1234)
+
+
+class TestNetworkPrinter:
+    """Test network printer support."""
+
+    def test_get_printer_network(self, monkeypatch):
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(settings, "PRINTER_TYPE", "network")
+        monkeypatch.setattr(settings, "PRINTER_HOST", "192.0.2.10")
+        monkeypatch.setattr(settings, "PRINTER_NETWORK_PORT", 9100)
+
+        device = printer.get_printer()
+
+        assert isinstance(device, printer.Network)
+        assert device.host == "192.0.2.10"
+        assert device.port == 9100
+
+    def test_get_printer_network_requires_host(self, monkeypatch):
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(settings, "PRINTER_TYPE", "network")
+        monkeypatch.setattr(settings, "PRINTER_HOST", "")
+
+        with pytest.raises(ValueError):
+            printer.get_printer()
+
+    def test_receipt_over_tcp_arrives_whole(self, order, monkeypatch):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(settings, "PRINTER_TYPE", "network")
+        monkeypatch.setattr(settings, "PRINTER_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "PRINTER_NETWORK_PORT", server.getsockname()[1])
+
+        try:
+            assert printer.print_receipt(order) is True
+            # The connection stays open for the next job until reset
+            printer.reset_printer()
+            conn, _ = server.accept()
+            with conn:
+                received = b""
+                while chunk := conn.recv(65536):
+                    received += chunk
+        finally:
+            server.close()
+
+        assert received.startswith(printer.ESC_INIT)
+        assert b"Masala Dosa" in received
+
+
+class TestPrinterSession:
+    """Test reuse of the shared printer connection."""
+
+    def test_connection_reused_across_jobs(self, order, chits_dir, monkeypatch):
+        devices = []
+
+        def connect():
+            devices.append(FakePrinter())
+            return devices[-1]
+
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(printer, "get_printer", connect)
+        printer.reset_printer()
+
+        assert printer.print_receipt(order) is True
+        assert printer.print_order_chit(order) is True
+
+        assert len(devices) == 1
+        assert len(devices[0].writes) == 2
+        assert devices[0].closed is False
+
+        printer.reset_printer()
+        assert devices[0].closed is True
+
+    def test_failed_job_drops_connection(self, fake_printer, order, monkeypatch):
+        def broken_write(msg):
+            raise OSError("printer unplugged")
+
+        monkeypatch.setattr(fake_printer, "_raw", broken_write)
+
+        assert printer.print_receipt(order) is False
+        assert fake_printer.closed is True
+        assert printer._shared_printer is None
+
+    def test_stale_connection_is_reopened_once(self, order, monkeypatch):
+        devices = []
+
+        def connect():
+            devices.append(FakePrinter())
+            return devices[-1]
+
+        def broken_write(msg):
+            raise OSError("connection reset")
+
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", True)
+        monkeypatch.setattr(printer, "get_printer", connect)
+        printer.reset_printer()
+
+        assert printer.print_receipt(order) is True
+        devices[0]._raw = broken_write
+
+        assert printer.print_receipt(order) is True
+        assert len(devices) == 2
+        assert devices[0].closed is True
+        assert len(devices[1].writes) == 1
+        printer.reset_printer()
+
+
+class TestAutoPrintPdf:
+    """Test that auto-print remembers the method that worked."""
+
+    def test_working_method_is_tried_first(self, monkeypatch):
+        calls = []
+
+        def method(name, works):
+            def run(pdf_path, printer_name):
+                calls.append(name)
+                return works
+            return (name, run)
+
+        monkeypatch.setattr(printer, "AUTO_PRINT_METHODS", (
+            method("first", False),
+            method("second", False),
+            method("third", True),
+        ))
+        monkeypatch.setattr(printer, "_auto_print_method", None)
+
+        assert printer._auto_print_pdf("chit.pdf", "POS-80") is True
+        assert calls == ["first", "second", "third"]
+
+        calls.clear()
+        assert printer._auto_print_pdf("chit.pdf", "POS-80") is True
+        assert calls == ["third"]
+
+
+class TestPrinterTestPage:
+    """Test the printer test page."""
+
+    def test_test_page_is_sent_in_one_write(self, fake_printer):
+        assert printer.test_printer() is True
+
+        assert len(fake_printer.writes) == 1
+        assert b"TEST RECEIPT" in fake_printer.writes[0]
+        assert fake_printer.writes[0].endswith(printer.FEED_AND_FULL_CUT)
+
+
+class TestPrintPdfToPrinter:
+    """Test launching external PDF print commands."""
+
+    def test_fire_and_forget_launches_without_waiting(self, tmp_path, monkeypatch):
+        pdf_path = tmp_path / "chit.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        launched = []
+        monkeypatch.setattr(printer, "_PDF_PRINT_BACKEND", printer._print_pdf_linux)
+        monkeypatch.setattr(printer, "_start_print_process", lambda args, label: launched.append((args, label)))
+
+        assert printer.print_pdf_to_printer(str(pdf_path), "POS-80") is True
+        assert launched == [(["lp", "-d", "POS-80", str(pdf_path)], "lp")]
+
+    def test_watcher_logs_failed_command(self, caplog):
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stderr.write('no such printer'); sys.exit(1)"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        printer._watch_print_process(process, "lp")
+
+        assert "lp print failed: no such printer" in caplog.text
+
+    def test_missing_sumatra_is_forgotten(self, tmp_path, monkeypatch):
+        stale_path = str(tmp_path / "SumatraPDF.exe")
+        monkeypatch.setattr(printer, "SUMATRA_PATHS", (stale_path,))
+
+        def launch(args, label):
+            raise FileNotFoundError(args[0])
+
+        monkeypatch.setattr(printer, "_start_print_process", launch)
+        printer.refresh_print_backend()
+        (tmp_path / "SumatraPDF.exe").write_bytes(b"")
+        assert printer._find_print_tool((stale_path,)) == stale_path
+        (tmp_path / "SumatraPDF.exe").unlink()
+
+        assert printer._print_via_sumatra("chit.pdf", "POS-80", fire_and_forget=True) is False
+        assert printer._find_print_tool((stale_path,)) is None
+
+    def test_stream_pipes_pdf_to_lp_on_linux(self, tmp_path, monkeypatch):
+        lp = tmp_path / "lp"
+        received = tmp_path / "received.pdf"
+        lp.write_text(f"#!/bin/sh\ncat > {received}\n")
+        lp.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path), prepend=":")
+        monkeypatch.setattr(printer, "_SYSTEM", "Linux")
+
+        assert printer.print_pdf_stream_to_printer(b"%PDF-1.4 chit", "POS-80") is True
+        assert received.read_bytes() == b"%PDF-1.4 chit"
+
+    def test_powershell_gets_names_through_environment(self, monkeypatch):
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append((args, kwargs["env"]))
+            return SimpleNamespace(returncode=0, stderr=b"")
+
+        monkeypatch.setattr(printer.subprocess, "run", fake_run)
+        printer_name = 'POS"; Remove-Item C:\\ -Recurse; "'
+
+        assert printer._print_via_powershell("C:\\chits\\chit.pdf", printer_name) is True
+
+        args, env = calls[0]
+        assert args[:3] == ["powershell", "-NoProfile", "-NonInteractive"]
+        assert printer_name not in " ".join(args)
+        assert env["PRN_NAME"] == printer_name
+        assert env["PDF_PATH"] == "C:\\chits\\chit.pdf"
+
+
+class TestPrintQueue:
+    """Test background printing of queued receipts and chits."""
+
+    def test_queued_receipt_is_printed_from_snapshot(self, fake_printer, order):
+        assert printer.queue_receipt(order) is True
+        order.table_number = 99
+        printer.wait_for_print_queue()
+
+        assert len(fake_printer.writes) == 1
+        assert b"Table 7" in fake_printer.writes[0]
+
+    def test_queued_chit_prints_only_given_items(self, fake_printer, order, chits_dir):
+        assert printer.queue_order_chit(order, items_to_print=[]) is True
+        printer.wait_for_print_queue()
+
+        assert fake_printer.writes == []
+
+    def test_wait_gives_up_and_drops_jobs_after_timeout(self, fake_printer, order, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+        write = fake_printer._raw
+
+        def stuck_write(msg):
+            started.set()
+            release.wait()
+            write(msg)
+
+        monkeypatch.setattr(fake_printer, "_raw", stuck_write)
+        printer.queue_receipt(order)
+        printer.queue_receipt(order)
+        assert started.wait(5)
+
+        assert printer.wait_for_print_queue(timeout=0.05) is False
+        release.set()
+        assert printer.wait_for_print_queue(timeout=5) is True
+        # The job already printing finished; the one still queued was dropped
+        assert len(fake_printer.writes) == 1
+
+    def test_shutdown_does_not_block_on_running_job(self, fake_printer, order, monkeypatch):
+        from app import main
+
+        started, release = threading.Event(), threading.Event()
+        write = fake_printer._raw
+
+        def stuck_write(msg):
+            started.set()
+            release.wait()
+            write(msg)
+
+        monkeypatch.setattr(fake_printer, "_raw", stuck_write)
+        monkeypatch.setattr(main, "PRINT_QUEUE_SHUTDOWN_TIMEOUT", 0.05)
+        printer.queue_receipt(order)
+        assert started.wait(5)
+
+        begin = time.monotonic()
+        main.shutdown_event()
+        elapsed = time.monotonic() - begin
+        # The running job still holds the printer, so it must not be closed under it
+        assert printer.reset_printer(timeout=0) is False
+        release.set()
+        assert printer.wait_for_print_queue(timeout=5) is True
+
+        assert elapsed < 1
+        assert fake_printer.closed is False
+        assert len(fake_printer.writes) == 1
+
+    def test_nothing_queued_when_printer_disabled(self, order, monkeypatch):
+        monkeypatch.setattr(settings, "PRINTER_ENABLED", False)
+
+        assert printer.queue_receipt(order) is False
+        assert printer.queue_order_chit(order) is False
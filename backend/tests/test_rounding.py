@@ -0,0 +1,28 @@
+"""
+Unit tests for bill rounding.
+"""
+
+from app.utils.rounding import round_down_to_rupee, round_to_nearest_rupee
+
+
+class TestRoundToNearestRupee:
+    """Test standard rounding to whole rupees."""
+
+    def test_rounds_half_up(self):
+        assert round_to_nearest_rupee(15749) == 15700
+        assert round_to_nearest_rupee(15750) == 15800
+        assert round_to_nearest_rupee(15650) == 15700
+
+    def test_large_amount_has_no_float_error(self):
+        assert round_to_nearest_rupee(123456789012345650) == 123456789012345700
+
+
+class TestRoundDownToRupee:
+    """Test rounding down in the customer's favour."""
+
+    def test_drops_paise(self):
+        assert round_down_to_rupee(15700) == 15700
+        assert round_down_to_rupee(15799) == 15700
+
+    def test_large_amount_has_no_float_error(self):
+        assert round_down_to_rupee(123456789012345699) == 123456789012345600